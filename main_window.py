@@ -141,6 +141,54 @@ class MainWindow(QtWidgets.QMainWindow):
                 color: #e0e0e0;
                 border-top: 1px solid #555555;
             }
+            
+            QHeaderView::section {
+                background-color: #2a2a2a;
+                color: #e0e0e0;
+                border: 1px solid #555555;
+                border-left: none;
+                border-right: 1px solid #555555;
+                border-top: none;
+                border-bottom: 1px solid #555555;
+                padding: 4px 8px;
+                font-weight: bold;
+                font-size: 11px;
+            }
+            
+            QHeaderView::section:first {
+                border-left: 1px solid #555555;
+            }
+            
+            QScrollBar:vertical, QScrollBar:horizontal {
+                background: #2a2a2a;
+                border: 1px solid #555555;
+            }
+            
+            QScrollBar:vertical {
+                width: 16px;
+            }
+            
+            QScrollBar:horizontal {
+                height: 16px;
+            }
+            
+            QScrollBar::handle:vertical, QScrollBar::handle:horizontal {
+                background: #4a4a4a;
+                border: 1px solid #666666;
+                border-radius: 3px;
+            }
+            
+            QScrollBar::handle:vertical {
+                min-height: 20px;
+            }
+            
+            QScrollBar::handle:horizontal {
+                min-width: 20px;
+            }
+            
+            QScrollBar::handle:vertical:hover, QScrollBar::handle:horizontal:hover {
+                background: #5a5a5a;
+            }
         """)
         
         main_widget = QtWidgets.QWidget()
@@ -196,6 +244,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.results_table = ValidationResultsTable()
         results_layout.addWidget(self.results_table)
         
+        # Table rows are single-line; the full details of the selected result show here
+        self.result_details_view = QtWidgets.QPlainTextEdit()
+        self.result_details_view.setReadOnly(True)
+        self.result_details_view.setMaximumHeight(70)
+        self.result_details_view.setPlaceholderText("Select a result to see its full details.")
+        results_layout.addWidget(self.result_details_view)
+        self.results_table.selectionModel().currentRowChanged.connect(self._show_selected_result_details)
+        
         self.splitter.addWidget(results_container)
         self.splitter.setSizes([400, 600])
 
@@ -231,9 +287,14 @@ class MainWindow(QtWidgets.QMainWindow):
             # if len(current_sizes) == 2 and current_sizes[0] > 0 : # if editor was visible
             #    self.splitter.setSizes([0, current_sizes[0] + current_sizes[1]])
 
+    def _show_selected_result_details(self, *args):
+        """Show the full details text of the selected result below the table."""
+        self.result_details_view.setPlainText(self.results_table.get_selected_details() or "")
+
     def run_validation(self):
         self.statusBar().showMessage("Running validation...")
         self.results_table.clear_results()
+        self.result_details_view.clear()
 
         # Always reload rules from YAML before validating
         if hasattr(self.validator, 'rules_file_path') and self.validator.rules_file_path:
@@ -263,6 +324,7 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             self.statusBar().showMessage("Validation complete: No issues found.", 5000)
         else:
+            result_rows = []
             for issue_data in issues:
                 severity = issue_data.get('severity', 'info').lower()
                 node_name = issue_data.get('node', 'N/A')
@@ -291,13 +353,15 @@ class MainWindow(QtWidgets.QMainWindow):
                 else:
                     rule_name = rule_type
                 
-                # Add to table with node name for "Go to Node" button
-                self.results_table.add_validation_result(
+                # Collect for the table with node name for "Go to Node" button
+                result_rows.append((
                     rule_name,
                     severity,
                     details,
                     node_name if node_name != 'N/A' else None
-                )
+                ))
+            
+            self.results_table.add_validation_results_batch(result_rows)
                 
             self.statusBar().showMessage(f"Validation complete: {len(issues)} issues found.", 5000)
         
@@ -342,7 +342,7 @@ class NukeValidator:
             
             # Import the sophisticated validation from the UI
             try:
-                from nuke_validator_ui import FilenameRuleEditor, FILENAME_TOKENS
+                from nuke_validator_ui import FilenameRuleEditor, FILENAME_TOKENS_BY_NAME
                 print(f"[Validator] Successfully imported UI validation components")
             except ImportError as import_err:
                 print(f"[Validator] UI import failed: {import_err}")
@@ -371,7 +371,7 @@ class NukeValidator:
                 for token_cfg in filename_tokens:
                     if "name" in token_cfg:
                         # Find the token definition
-                        token_def = next((t for t in FILENAME_TOKENS if t["name"] == token_cfg["name"]), None)
+                        token_def = FILENAME_TOKENS_BY_NAME.get(token_cfg["name"])
                         if token_def:
                             temp_editor.template_builder.add_token(token_def)
                             token_loaded = True
@@ -634,6 +634,15 @@ class NukeValidator:
         severity_relative = path_rules.get('severity_relative_path', 'warning')
         severity_naming = path_rules.get('severity_naming_pattern', 'warning')
         token_defs = self.rules.get('token_definitions', {})
+        pattern_str = path_rules.get('naming_pattern_regex')
+        # Compiled once for all Write nodes; a bad pattern is still reported on each node below
+        naming_regex = None
+        naming_regex_error = None
+        if pattern_str:
+            try:
+                naming_regex = re.compile(pattern_str)
+            except re.error as e:
+                naming_regex_error = e
 
         for node in nodes:
             if node.Class() == 'Write':
@@ -662,7 +671,6 @@ class NukeValidator:
                             'severity': severity_relative
                         })
                 # 2. Dynamic Naming Convention Check (using regex)
-                pattern_str = path_rules.get('naming_pattern_regex')
                 filename = os.path.basename(file_path)
                 if not pattern_str:
                     self.issues.append({
@@ -683,7 +691,9 @@ class NukeValidator:
                         f.write(f"Checking filename: '{filename}'\n")
                         f.write(f"Against pattern: '{pattern_str}'\n")
                     
-                    match_result = re.match(pattern_str, filename)
+                    if naming_regex_error is not None:
+                        raise naming_regex_error
+                    match_result = naming_regex.match(filename)
                     print(f"[DEBUG] Match result: {match_result is not None}")
                     
                     # Write match result to debug file
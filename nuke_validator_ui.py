@@ -7,7 +7,6 @@ Nuke Validator UI - A comprehensive UI for the Nuke Validator
 Public classes:
 - ValidationResultsTable: Excel-like table for displaying validation results
 - RulesEditorWidget: Widget for editing validation rules
-- RuleItemWidget: DEPRECATED - Legacy validation result widget
 - FilenameRuleEditor: Widget for editing filename validation rules
 - PathRuleEditor: Widget for editing path structure rules
 """
@@ -16,11 +15,26 @@ Public classes:
 # IMPORTS
 # ===============================================================================
 # Standard library imports
+import contextlib
 import functools
+import json
 import os
 import re  # For regex generation
+import sys
 import yaml
 
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YLoader, CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeLoader as _YLoader, SafeDumper as _YDumper
+
+# Nuke is only present when running inside Nuke; the UI also runs standalone
+try:
+    import nuke
+except ImportError:
+    nuke = None
+
 # Type annotations
 from typing import Any, Dict, Optional
 
@@ -183,6 +197,362 @@ FILENAME_TOKENS = [
     },
 ]
 
+# Token name -> definition, for O(1) lookups in the regex/validation loops
+FILENAME_TOKENS_BY_NAME = {token["name"]: token for token in FILENAME_TOKENS}
+
+# Separator choices offered by every template builder; "(none)" stands for no separator
+SEPARATOR_OPTIONS = ["_", ".", "-", " ", "(none)"]
+
+# Regex-escaped forms of the separators the template builders offer
+_ESCAPED_SEPS = {sep: re.escape(sep) for sep in ("_", ".", "-", " ", "")}
+
+# Common regex fragments -> sample text, for examples built from a hand-written regex
+# (plain substring replacements; none of the sample texts contains another fragment)
+_EXAMPLE_SUBS = (
+    ("[A-Z]{4}", "DEMO"),
+    ("\\d{4}", "0010"),
+    ("\\d{1,2}k", "2k"),
+    ("v\\d{3}", "v001"),
+    ("(?i)(jpg|jpeg|png|mxf|mov|exr)", "jpg"),
+)
+# Every fragment above contains one of these; a regex with none of them needs no substitution
+_EXAMPLE_FRAGMENT_MARKERS = ("[A-Z]{4}", "\\d", "(?i)(")
+
+# Directory this module was loaded from (rules YAML files and icons live next to it)
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# --- Status Icons ---
+# Resolved and listed once at import so icon lookups don't stat the (often network) install dir
+_ICONS_DIR = os.path.join(_SCRIPT_DIR, "icons")
+_ICONS_PRESENT = frozenset(os.listdir(_ICONS_DIR)) if os.path.isdir(_ICONS_DIR) else frozenset()
+
+# Status -> icon file / accent color, shared by the results model and the status labels
+_STATUS_ICON_FILES = {
+    'success': 'success.png',
+    'warning': 'warning.png',
+    'error': 'error.png',
+    'running': 'info.png',
+    'pending': 'info.png'
+}
+
+_STATUS_COLORS = {
+    'success': '#4caf50',
+    'warning': '#ff9800',
+    'error': '#f44336',
+    'running': '#2196f3',
+    'pending': '#757575'
+}
+
+# Colored-circle fill used when a status PNG is missing
+_STATUS_FALLBACK_COLORS = {
+    'success': QtGui.QColor(76, 175, 80),
+    'warning': QtGui.QColor(255, 152, 0),
+    'error': QtGui.QColor(244, 67, 54),
+    'running': QtGui.QColor(33, 150, 243),
+    'pending': QtGui.QColor(120, 120, 120)
+}
+
+# --- Path Structure Tokens ---
+# Interned once so PathRuleEditor.token_controls lookups compare by identity
+_SHOT_TOKEN = sys.intern("<shot_name>")
+_RES_TOKEN = sys.intern("<resolution>")
+_VER_TOKEN = sys.intern("<version>")
+
+# --- Token Row Stylesheets ---
+# Shared by every SimpleTokenWidget / SimpleMultiSelectWidget instead of rebuilding the strings per row
+_TOKEN_LABEL_QSS = """
+QLabel {
+    color: #e0e0e0;
+    font-size: 11px;
+    padding: 2px 4px;
+}
+"""
+
+_TOKEN_CONTROL_QSS = """
+QWidget {
+    background: #3a3a3a;
+    color: #e0e0e0;
+    border: 1px solid #555;
+    border-radius: 3px;
+    padding: 2px 4px;
+    font-size: 11px;
+}
+QComboBox::drop-down {
+    border: none;
+    width: 16px;
+}
+QComboBox::down-arrow {
+    image: none;
+    border-left: 3px solid transparent;
+    border-right: 3px solid transparent;
+    border-top: 3px solid #e0e0e0;
+}
+QComboBox QAbstractItemView {
+    background: #3a3a3a;
+    color: #e0e0e0;
+    selection-background-color: #4a9eff;
+}
+"""
+
+_ARROW_BTN_QSS = """
+QPushButton {
+    background: #4a4a4a;
+    color: #e0e0e0;
+    border: 1px solid #666;
+    border-radius: 2px;
+    font-size: 8px;
+    padding: 0px;
+}
+QPushButton:hover { background: #5a5a5a; }
+QPushButton:pressed { background: #2a2a2a; }
+"""
+
+_SEPARATOR_COMBO_QSS = """
+QComboBox {
+    background: #3a3a3a;
+    color: #e0e0e0;
+    border: 1px solid #555;
+    border-radius: 3px;
+    padding: 2px 4px;
+    font-size: 11px;
+}
+QComboBox::drop-down {
+    border: none;
+    width: 16px;
+}
+QComboBox::down-arrow {
+    image: none;
+    border-left: 3px solid transparent;
+    border-right: 3px solid transparent;
+    border-top: 3px solid #e0e0e0;
+}
+QComboBox QAbstractItemView {
+    background: #3a3a3a;
+    color: #e0e0e0;
+    selection-background-color: #4a9eff;
+}
+"""
+
+_REMOVE_BTN_QSS = """
+QPushButton {
+    background: #d32f2f;
+    color: white;
+    border: none;
+    border-radius: 10px;
+    font-size: 12px;
+    font-weight: bold;
+}
+QPushButton:hover { background: #f44336; }
+QPushButton:pressed { background: #b71c1c; }
+"""
+
+# Multiselect popup and its list; the QListView rules come last so they win over QWidget
+_MULTISELECT_POPUP_QSS = """
+QWidget {
+    background: white;
+    border: 2px solid #ccc;
+    border-radius: 4px;
+}
+QListView {
+    color: #333;
+    font-size: 10px;
+    background: white;
+    border: none;
+}
+QListView::item {
+    padding: 2px;
+}
+QListView::indicator {
+    width: 12px;
+    height: 12px;
+}
+QListView::indicator:unchecked {
+    background: white;
+    border: 1px solid #ccc;
+}
+QListView::indicator:checked {
+    background: #0078d4;
+    border: 1px solid #0078d4;
+}
+"""
+
+# --- Compact Builder Stylesheet ---
+# Installed once on CompactFilenameTemplateBuilder; the builder's own controls and each
+# CompactTokenWidget's parts are matched by objectName rather than parsing a sheet per widget:
+#   compactHeaderLabel  - "Template Order:" header
+#   compactClearButton  - Clear All button
+#   compactTokenLabel   - token name label
+#   compactRemoveButton - × button
+#   compactTokenControl - value control (and its children)
+#   compactSeparator    - separator combo
+#   compactArrowButton  - ↑/↓ buttons
+_COMPACT_BUILDER_QSS = """
+CompactFilenameTemplateBuilder {
+    background: #2a2a2a;
+    border: 1px solid #555;
+    border-radius: 4px;
+}
+QLabel#compactHeaderLabel { color: #e0e0e0; font-weight: bold; font-size: 11px; }
+QPushButton#compactClearButton {
+    background: #444;
+    color: #e0e0e0;
+    border: 1px solid #666;
+    border-radius: 2px;
+    padding: 2px 8px;
+    font-size: 10px;
+}
+QPushButton#compactClearButton:hover { background: #555; }
+QPushButton#compactClearButton:pressed { background: #333; }
+CompactTokenWidget {
+    background: #383838;
+    border: 1px solid #555;
+    border-radius: 4px;
+    margin: 1px;
+}
+CompactTokenWidget:hover {
+    border: 1px solid #4a9eff;
+    background: #404040;
+}
+QLabel#compactTokenLabel {
+    background: #4a4a4a;
+    color: #e0e0e0;
+    border: 1px solid #666;
+    border-radius: 3px;
+    padding: 2px 4px;
+    font-size: 9px;
+    font-weight: bold;
+    min-width: 70px;
+}
+QPushButton#compactRemoveButton {
+    background: #d32f2f;
+    color: white;
+    border: none;
+    border-radius: 8px;
+    font-size: 10px;
+    font-weight: bold;
+}
+QPushButton#compactRemoveButton:hover { background: #f44336; }
+QPushButton#compactRemoveButton:pressed { background: #b71c1c; }
+#compactTokenControl, #compactTokenControl QWidget {
+    background: #3a3a3a;
+    color: #e0e0e0;
+    border: 1px solid #555;
+    border-radius: 2px;
+    font-size: 8px;
+}
+QComboBox#compactTokenControl::drop-down {
+    border: none;
+    width: 12px;
+}
+QComboBox#compactTokenControl::down-arrow {
+    border-left: 2px solid transparent;
+    border-right: 2px solid transparent;
+    border-top: 2px solid #e0e0e0;
+}
+QComboBox#compactSeparator {
+    background: #3a3a3a;
+    color: #e0e0e0;
+    border: 1px solid #555;
+    border-radius: 2px;
+    font-size: 8px;
+}
+QPushButton#compactArrowButton {
+    background: #4a4a4a;
+    color: #e0e0e0;
+    border: 1px solid #666;
+    border-radius: 2px;
+    font-size: 8px;
+    padding: 0px;
+}
+QPushButton#compactArrowButton:hover { background: #5a5a5a; }
+QPushButton#compactArrowButton:pressed { background: #2a2a2a; }
+QPushButton#compactArrowButton:disabled { background: #2a2a2a; color: #666; }
+"""
+
+# --- Filename Editor Stylesheet ---
+# Installed once on FilenameRuleEditor; its widgets pick rules up by objectName instead of
+# each parsing its own sheet:
+#   tokenPaletteButton - token buttons in the palette
+#   templateFileButton - Save/Load Template buttons
+#   tokenControl       - value editor created by the template builder (and its children)
+#   tokenSeparator     - separator combo created by the template builder
+_FILENAME_EDITOR_QSS = """
+QPushButton#tokenPaletteButton {
+    background: #4a4a4a;
+    color: #e0e0e0;
+    border: 1px solid #666;
+    border-radius: 3px;
+    font-size: 10px;
+    padding: 2px 4px;
+}
+QPushButton#tokenPaletteButton:hover {
+    background: #5a5a5a;
+    border: 1px solid #777;
+}
+QPushButton#tokenPaletteButton:pressed {
+    background: #3a3a3a;
+    border: 1px solid #555;
+}
+QPushButton#templateFileButton {
+    background: #4a4a4a;
+    color: #e0e0e0;
+    border: 1px solid #666;
+    border-radius: 3px;
+    font-size: 10px;
+    padding: 4px 12px;
+}
+QPushButton#templateFileButton:hover { background: #5a5a5a; }
+QPushButton#templateFileButton:pressed { background: #3a3a3a; }
+#tokenControl, #tokenControl QWidget {
+    background: #3a3a3a;
+    color: #e0e0e0;
+    border: 1px solid #555;
+    border-radius: 3px;
+    font-size: 10px;
+}
+QComboBox#tokenControl::drop-down {
+    border: none;
+    width: 20px; /* Wider dropdown button */
+}
+QComboBox#tokenControl::down-arrow {
+    border-left: 4px solid transparent;
+    border-right: 4px solid transparent;
+    border-top: 4px solid #e0e0e0;
+}
+QComboBox#tokenControl {
+    padding-left: 6px;
+    padding-right: 20px; /* More padding for text */
+    text-align: left;
+}
+QComboBox#tokenControl QAbstractItemView {
+    background: #3a3a3a;
+    color: #e0e0e0;
+    selection-background-color: #4a9eff;
+    padding: 4px;
+}
+QComboBox#tokenSeparator {
+    background: #3a3a3a;
+    color: #e0e0e0;
+    border: 1px solid #555;
+    border-radius: 3px;
+    font-size: 10px;
+}
+QComboBox#tokenSeparator::drop-down {
+    border: none;
+    width: 16px;
+}
+QComboBox#tokenSeparator::down-arrow {
+    border-left: 3px solid transparent;
+    border-right: 3px solid transparent;
+    border-top: 3px solid #e0e0e0;
+}
+QComboBox#tokenSeparator QAbstractItemView {
+    background: #3a3a3a;
+    color: #e0e0e0;
+    selection-background-color: #4a9eff;
+}
+"""
+
 # ===============================================================================
 # BASE WIDGETS - PRIMARY UI COMPONENTS
 # ===============================================================================
@@ -486,163 +856,6 @@ class SeparatorWidget(QtWidgets.QWidget):
     def get_token_config(self):
         return {"separator": self.sep}
 
-class RuleItemWidget(QtWidgets.QWidget):
-    """
-    Widget to display a single rule with progress and status
-    """
-    def __init__(self, rule_name, parent=None):
-        super(RuleItemWidget, self).__init__(parent)
-        self.rule_name = rule_name
-        
-        # Main layout - more condensed
-        layout = QtWidgets.QHBoxLayout(self)
-        layout.setContentsMargins(4, 2, 4, 2)
-        layout.setSpacing(6)
-
-        # Status icon (Column 1) - Smaller and more compact
-        self.status_icon = QtWidgets.QLabel()
-        self.status_icon.setFixedSize(24, 24)
-        self.status_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_icon.setScaledContents(True)
-        
-        # Create default icon with "pending" status
-        self.set_status("pending")
-        
-        layout.addWidget(self.status_icon, 0)
-
-        # Rule name label (Column 2) - Fixed width for consistency
-        self.name_label = QtWidgets.QLabel()
-        self.name_label.setFixedWidth(120)
-        self.name_label.setWordWrap(False)
-        self.name_label.setTextFormat(Qt.TextFormat.PlainText)
-        self.name_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        self.name_label.setStyleSheet("""
-            QLabel {
-                color: #e0e0e0;
-                font-size: 11px;
-                font-weight: bold;
-                padding: 2px 4px;
-                background: transparent;
-            }
-        """)
-        layout.addWidget(self.name_label, 0)
-
-        # Progress bar (conditionally visible, Column 3)
-        self.progress_bar = QtWidgets.QProgressBar()
-        self.progress_bar.setRange(0, 100)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setFixedWidth(80)
-        self.progress_bar.setFixedHeight(16)
-        self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                background: #2a2a2a;
-                border: 1px solid #444;
-                border-radius: 3px;
-                font-size: 9px;
-                color: #e0e0e0;
-            }
-            QProgressBar::chunk {
-                background: #4a9eff;
-                border-radius: 2px;
-            }
-        """)
-        layout.addWidget(self.progress_bar, 0)
-        
-        # Status label/details (Column 4) - Compact with dark styling
-        self.status_label = QtWidgets.QLabel()
-        self.status_label.setWordWrap(True)
-        self.status_label.setTextFormat(Qt.TextFormat.PlainText)
-        self.status_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #cccccc;
-                font-size: 10px;
-                padding: 2px 4px;
-                background: transparent;
-                line-height: 1.2;
-            }
-        """)
-        layout.addWidget(self.status_label, 1)
-        
-        # Apply dark theme styling to the widget itself
-        self.setStyleSheet("""
-            RuleItemWidget {
-                background: #3a3a3a;
-                border: 1px solid #555;
-                border-radius: 3px;
-                margin: 1px;
-            }
-            RuleItemWidget:hover {
-                background: #404040;
-                border: 1px solid #666;
-            }
-        """)
-        
-        # Make the widget more compact
-        self.setFixedHeight(32)
-
-    def set_status(self, status):
-        """
-        Set the status icon for this rule item.
-        Args:
-            status (str): One of 'success', 'warning', 'error', 'running', 'pending'
-        """
-        # Get the icons directory path
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        icons_dir = os.path.join(script_dir, "icons")
-        
-        # Map status to PNG file names
-        icon_files = {
-            'success': 'success.png',
-            'warning': 'warning.png', 
-            'error': 'error.png',
-            'running': 'info.png',  # Use info.png for running state
-            'pending': 'info.png'   # Use info.png for pending state
-        }
-        
-        # Load the appropriate PNG icon
-        icon_file = icon_files.get(status, 'info.png')  # Default to info.png
-        icon_path = os.path.join(icons_dir, icon_file)
-        
-        if os.path.exists(icon_path):
-            # Load PNG and scale to 24x24
-            pixmap = QtGui.QPixmap(icon_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(24, 24, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self.status_icon.setPixmap(scaled_pixmap)
-            else:
-                # Fallback to a simple colored square if PNG fails to load
-                self._create_fallback_icon(status)
-        else:
-            # Fallback to a simple colored square if PNG file doesn't exist
-            self._create_fallback_icon(status)
-    
-    def _create_fallback_icon(self, status):
-        """Create a simple fallback icon if PNG loading fails"""
-        # Status colors - more muted for dark theme
-        colors = {
-            'success': QtGui.QColor(76, 175, 80, 180),    # Green with some transparency
-            'warning': QtGui.QColor(255, 152, 0, 180),    # Orange with some transparency
-            'error': QtGui.QColor(244, 67, 54, 180),      # Red with some transparency
-            'running': QtGui.QColor(33, 150, 243, 180),   # Blue with some transparency
-            'pending': QtGui.QColor(120, 120, 120, 180)   # Gray with some transparency
-        }
-        
-        color = colors.get(status, colors['pending'])
-        pixmap = QtGui.QPixmap(24, 24)
-        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
-        
-        painter = QtGui.QPainter(pixmap)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QtGui.QBrush(color))
-        painter.setPen(QtCore.Qt.PenStyle.NoPen)
-        painter.drawEllipse(2, 2, 20, 20)  # Draw a circle with some padding
-        painter.end()
-        
-        self.status_icon.setPixmap(pixmap)
-
 class RulesEditorWidget(QtWidgets.QWidget):
     """
     Widget for editing rules with a graphical interface
@@ -654,11 +867,21 @@ class RulesEditorWidget(QtWidgets.QWidget):
         self.main_window_parent = parent
         
         # Default path for rules.yaml
-        self.rules_yaml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules.yaml")
+        self.rules_yaml_path = os.path.join(_SCRIPT_DIR, "rules.yaml")
         # Track the currently loaded YAML file name for display purposes
         self.current_yaml_name = "rules.yaml"
-        self.dropdown_yaml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules_dropdowns.yaml")
+        self.dropdown_yaml_path = os.path.join(_SCRIPT_DIR, "rules_dropdowns.yaml")
         self.dropdown_options = self._load_yaml_file(self.dropdown_yaml_path) or {}
+        # Flatten the render settings subtrees once so file type switches don't re-walk them
+        self._rs_opts = self.dropdown_options.get('render_settings') or {}
+        self._rs_exr = self._rs_opts.get('exr') or {}
+        self._rs_mov = self._rs_opts.get('mov') or {}
+        self._rs_jpg = self._rs_opts.get('jpg') or {}
+        self._rs_exr_datatype = self._rs_exr.get('datatype_options')
+        self._rs_exr_compression = self._rs_exr.get('compression_options')
+        self._rs_mov_codec = self._rs_mov.get('codec_options')
+        self._rs_jpg_quality = self._rs_jpg.get('_jpeg_quality_options')
+        self._rs_jpg_sub_sampling = self._rs_jpg.get('_jpeg_sub_sampling_options')
         
         # Initialize attributes for dynamic filename validation
         self.filename_template = DEFAULT_FILENAME_TEMPLATE
@@ -740,6 +963,8 @@ class RulesEditorWidget(QtWidgets.QWidget):
         
         main_editor_layout.addLayout(button_layout)
         
+        # Rule sections applied by the last load; sections absent from a file are only reset if listed here
+        self._applied_rule_sections = set()
         self.load_rules_from_yaml() # Load rules on init (will populate UI elements)
         
         if self.category_list.count() > 0:
@@ -775,29 +1000,39 @@ class RulesEditorWidget(QtWidgets.QWidget):
                 options = ["24", "25", "30", "50", "60", "2997", "5994"]
         if isinstance(options, dict):
             model = QStandardItemModel()
+            index_map = {}
             for group, items in options.items():
                 group_item = QStandardItem(group)
                 group_item.setFlags(QtCore.Qt.NoItemFlags)  # Non-selectable
+                index_map.setdefault(group, model.rowCount())
                 model.appendRow(group_item)
                 for opt in items:
                     item = QStandardItem(opt)
+                    index_map.setdefault(opt, model.rowCount())
                     model.appendRow(item)
             combobox.setModel(model)
             # Set default if provided
             if default_value:
-                for i in range(model.rowCount()):
-                    if model.item(i).text() == default_value:
-                        combobox.setCurrentIndex(i)
-                        break
+                idx = index_map.get(default_value, -1)
+                if idx >= 0:
+                    combobox.setCurrentIndex(idx)
         elif isinstance(options, list):
-            combobox.addItems([str(opt) for opt in options])
+            items = [str(opt) for opt in options]
+            combobox.addItems(items)
+            index_map = {}
+            for i, text in enumerate(items):
+                index_map.setdefault(text, i)
             if default_value and default_value in options:
-                combobox.setCurrentText(str(default_value))
+                # Like setCurrentText: no change if the text form isn't an item (e.g. 24.0)
+                idx = index_map.get(str(default_value), -1)
+                if idx >= 0:
+                    combobox.setCurrentIndex(idx)
             elif options:
                 combobox.setCurrentIndex(0)
             # Always set default to 24 if present
-            if combobox.count() > 0 and combobox.findText("24") >= 0:
-                combobox.setCurrentText("24")
+            idx = index_map.get("24", -1)
+            if idx >= 0:
+                combobox.setCurrentIndex(idx)
         else:
             combobox.clear()
 
@@ -941,6 +1176,7 @@ class RulesEditorWidget(QtWidgets.QWidget):
         channels_layout = QtWidgets.QFormLayout()
         
         self.ch_require_rgba_check = QtWidgets.QCheckBox("Require RGBA channels in Write nodes")
+        self.ch_require_rgba_check.setChecked(True) # Default, will be loaded from rules
         channels_layout.addRow("", self.ch_require_rgba_check)
 
         self.ch_warn_rgb_only_check = QtWidgets.QCheckBox("Warn if only RGB channels (no Alpha) in Write nodes")
@@ -961,7 +1197,7 @@ class RulesEditorWidget(QtWidgets.QWidget):
         self.rs_layout = QtWidgets.QFormLayout()
         
         self.rs_file_type_combo = QtWidgets.QComboBox()
-        self._populate_combobox(self.rs_file_type_combo, self.dropdown_options.get('render_settings', {}).get('file_type_options'))
+        self._populate_combobox(self.rs_file_type_combo, self._rs_opts.get('file_type_options'))
         self.rs_layout.addRow("File Type to Configure:", self.rs_file_type_combo)
         self.rs_file_type_combo.currentTextChanged.connect(self._update_render_settings_ui)
 
@@ -1131,7 +1367,7 @@ class RulesEditorWidget(QtWidgets.QWidget):
             token_name = token_cfg.get("name")
             if token_name:
                 # Find the current master definition for this token
-                master_def = next((t for t in FILENAME_TOKENS if t["name"] == token_name), None)
+                master_def = FILENAME_TOKENS_BY_NAME.get(token_name)
                 if master_def:
                     # Create a new token config with updated token_def from master
                     updated_token = {
@@ -1412,114 +1648,122 @@ class RulesEditorWidget(QtWidgets.QWidget):
         self.filename_rule_editor.template_builder.clear()
         # Ensure filename_rule_editor and its template_builder are available
         if hasattr(self, 'filename_rule_editor') and hasattr(self.filename_rule_editor, 'template_builder'):
-            for token_cfg_from_template in fp_rules.get('filename_tokens', []): # These are the tokens saved as part of a specific template
-                if "name" in token_cfg_from_template:
-                    # Find the full definition of this token from the available tokens for the editor
-                    # First check if there's a master definition in FILENAME_TOKENS
-                    master_def = next((t for t in FILENAME_TOKENS if t["name"] == token_cfg_from_template["name"]), None)
+            # Hold back per-token change notifications; the regex is rebuilt once after the loop
+            with self.filename_rule_editor.template_builder.suppress_notifications():
+                table_needs_rebuild = False
+                for token_cfg_from_template in fp_rules.get('filename_tokens', []): # These are the tokens saved as part of a specific template
+                    if "name" in token_cfg_from_template:
+                        # Find the full definition of this token from the available tokens for the editor
+                        # First check if there's a master definition in FILENAME_TOKENS
+                        master_def = FILENAME_TOKENS_BY_NAME.get(token_cfg_from_template["name"])
                     
-                    # If found in master definitions, use that
-                    if master_def:
-                        # Create a copy to avoid modifying the original
-                        full_token_def = master_def.copy()
-                        # Add the token to the template builder using the master definition
-                        self.filename_rule_editor.template_builder.add_token(full_token_def)
-                        # Alias for clarity in the existing logic below
-                        token_cfg = token_cfg_from_template
-                    else:
-                        # Fallback to the editor's token definitions if not found in master
-                        full_token_def = next((t_def for t_def in self.filename_tokens_for_editor if t_def["name"] == token_cfg_from_template["name"]), None)
-                        
-                        if full_token_def:
-                            # Before adding, check if there's a master definition for this token name
-                            # This is a second check to ensure we always use master definitions
-                            master_def = next((t for t in FILENAME_TOKENS if t["name"] == token_cfg_from_template["name"]), None)
-                            if master_def and "regex_template" in master_def:
-                                full_token_def["regex_template"] = master_def["regex_template"]
-                                
-                            # Add the token to the template builder using its full definition
+                        # If found in master definitions, use that
+                        if master_def:
+                            # Create a copy to avoid modifying the original
+                            full_token_def = master_def.copy()
+                            # Add the token to the template builder using the master definition
                             self.filename_rule_editor.template_builder.add_token(full_token_def)
                             # Alias for clarity in the existing logic below
                             token_cfg = token_cfg_from_template
+                        else:
+                            # Fallback to the editor's token definitions if not found in master
+                            full_token_def = next((t_def for t_def in self.filename_tokens_for_editor if t_def["name"] == token_cfg_from_template["name"]), None)
+                        
+                            if full_token_def:
+                                # Before adding, check if there's a master definition for this token name
+                                # This is a second check to ensure we always use master definitions
+                                master_def = FILENAME_TOKENS_BY_NAME.get(token_cfg_from_template["name"])
+                                if master_def and "regex_template" in master_def:
+                                    full_token_def["regex_template"] = master_def["regex_template"]
+                                
+                                # Add the token to the template builder using its full definition
+                                self.filename_rule_editor.template_builder.add_token(full_token_def)
+                                # Alias for clarity in the existing logic below
+                                token_cfg = token_cfg_from_template
+                            else:
+                                # Unknown token name; nothing was added to configure
+                                continue
                     
-                    # For TableBasedFilenameTemplateBuilder, we need to configure the token differently
-                    if hasattr(self.filename_rule_editor.template_builder, 'token_configs'):
-                        # Table-based approach - find the config we just added and update it
-                        token_configs = self.filename_rule_editor.template_builder.token_configs
-                        if token_configs:
-                            # Get the last added token config
-                            last_config = token_configs[-1]
+                        # For TableBasedFilenameTemplateBuilder, we need to configure the token differently
+                        if hasattr(self.filename_rule_editor.template_builder, 'token_configs'):
+                            # Table-based approach - find the config we just added and update it
+                            token_configs = self.filename_rule_editor.template_builder.token_configs
+                            if token_configs:
+                                # Get the last added token config
+                                last_config = token_configs[-1]
                             
-                            # Update the configuration directly
-                            if token_cfg.get("value") is not None:
-                                last_config["value"] = token_cfg["value"]
-                            if "separator" in token_cfg:
-                                last_config["separator"] = token_cfg["separator"]
+                                # Update the configuration directly
+                                if token_cfg.get("value") is not None:
+                                    last_config["value"] = token_cfg["value"]
+                                if "separator" in token_cfg:
+                                    last_config["separator"] = token_cfg["separator"]
                             
-                            # Rebuild the table to reflect changes
-                            self.filename_rule_editor.template_builder._rebuild_table()
+                                # Rebuild the table once all tokens are configured
+                                table_needs_rebuild = True
                             
-                            print(f"TABLE-BASED DEBUG: Configured token {token_cfg['name']}")
-                            print(f"  Value: {last_config.get('value')}")
-                            print(f"  Separator: {last_config.get('separator')}")
+                                print(f"TABLE-BASED DEBUG: Configured token {token_cfg['name']}")
+                                print(f"  Value: {last_config.get('value')}")
+                                print(f"  Separator: {last_config.get('separator')}")
                     
-                    # Legacy approach for widget-based builders
-                    elif hasattr(self.filename_rule_editor.template_builder, 'token_widgets'):
-                        token_widgets = self.filename_rule_editor.template_builder.token_widgets
-                        if token_widgets:
-                            widget = token_widgets[-1]
+                        # Legacy approach for widget-based builders
+                        elif hasattr(self.filename_rule_editor.template_builder, 'token_widgets'):
+                            token_widgets = self.filename_rule_editor.template_builder.token_widgets
+                            if token_widgets:
+                                widget = token_widgets[-1]
                             
-                            # Set control value
-                            if token_cfg.get("value") is not None:
-                                if hasattr(widget, 'control') and widget.control:
-                                    try:
-                                        if isinstance(widget.control, QtWidgets.QSpinBox):
-                                            widget.control.setValue(token_cfg["value"])
-                                        elif isinstance(widget.control, QtWidgets.QComboBox):
-                                            idx = widget.control.findText(str(token_cfg["value"]))
-                                            if idx >= 0:
-                                                widget.control.setCurrentIndex(idx)
-                                        elif isinstance(widget.control, SimpleMultiSelectWidget):
-                                            # Ensure value is a list for multiselect
-                                            if isinstance(token_cfg["value"], list):
-                                                values_to_set = token_cfg["value"]
-                                            elif token_cfg["value"]:
-                                                values_to_set = [str(token_cfg["value"])]
-                                            else:
-                                                values_to_set = []
+                                # Set control value
+                                if token_cfg.get("value") is not None:
+                                    if hasattr(widget, 'control') and widget.control:
+                                        try:
+                                            if isinstance(widget.control, QtWidgets.QSpinBox):
+                                                widget.control.setValue(token_cfg["value"])
+                                            elif isinstance(widget.control, QtWidgets.QComboBox):
+                                                idx = widget.control.findText(str(token_cfg["value"]))
+                                                if idx >= 0:
+                                                    widget.control.setCurrentIndex(idx)
+                                            elif isinstance(widget.control, SimpleMultiSelectWidget):
+                                                # Ensure value is a list for multiselect
+                                                if isinstance(token_cfg["value"], list):
+                                                    values_to_set = token_cfg["value"]
+                                                elif token_cfg["value"]:
+                                                    values_to_set = [str(token_cfg["value"])]
+                                                else:
+                                                    values_to_set = []
                                             
-                                            print(f"MULTISELECT DEBUG: Loading {token_cfg['name']}")
-                                            print(f"  Raw value from config: {token_cfg['value']} (type: {type(token_cfg['value'])})")
-                                            print(f"  Values to set: {values_to_set}")
-                                            print(f"  Widget options: {list(widget.control.checkboxes.keys()) if hasattr(widget.control, 'checkboxes') else 'No checkboxes'}")
+                                                print(f"MULTISELECT DEBUG: Loading {token_cfg['name']}")
+                                                print(f"  Raw value from config: {token_cfg['value']} (type: {type(token_cfg['value'])})")
+                                                print(f"  Values to set: {values_to_set}")
+                                                print(f"  Widget options: {[o for o in widget.control.options if o != 'none']}")
                                             
-                                            widget.control.set_selected_values(values_to_set)
+                                                widget.control.set_selected_values(values_to_set)
                                             
-                                            # Verify immediately after setting
-                                            actual_values = widget.control.get_selected_values()
-                                            print(f"  Values after setting: {actual_values}")
-                                            print(f"  Summary text: {widget.control.summary_button.text()}")
-                                            print("---")
-                                    except (RuntimeError, AttributeError) as e:
-                                        pass  # Widget may not support the operation
+                                                # Verify immediately after setting
+                                                actual_values = widget.control.get_selected_values()
+                                                print(f"  Values after setting: {actual_values}")
+                                                print(f"  Summary text: {widget.control.summary_button.text()}")
+                                                print("---")
+                                        except (RuntimeError, AttributeError) as e:
+                                            pass  # Widget may not support the operation
                             
-                            # Set separator from token config
-                            if "separator" in token_cfg and hasattr(widget, 'separator_combo'):
-                                separator = token_cfg["separator"]
-                                if not separator:
-                                    separator = "(none)"
-                                try:
-                                    idx = widget.separator_combo.findText(separator)
-                                    if idx >= 0:
-                                        widget.separator_combo.setCurrentIndex(idx)
-                                    else:
-                                        # If the exact separator isn't found, default to "_"
-                                        default_idx = widget.separator_combo.findText("_")
-                                        if default_idx >= 0:
-                                            widget.separator_combo.setCurrentIndex(default_idx)
-                                except (RuntimeError, AttributeError):
-                                    pass  # Widget may not exist yet
-            # Update regex after adding each token
+                                # Set separator from token config
+                                if "separator" in token_cfg and hasattr(widget, 'separator_combo'):
+                                    separator = token_cfg["separator"]
+                                    if not separator:
+                                        separator = "(none)"
+                                    try:
+                                        idx = widget.separator_combo.findText(separator)
+                                        if idx >= 0:
+                                            widget.separator_combo.setCurrentIndex(idx)
+                                        else:
+                                            # If the exact separator isn't found, default to "_"
+                                            default_idx = widget.separator_combo.findText("_")
+                                            if default_idx >= 0:
+                                                widget.separator_combo.setCurrentIndex(default_idx)
+                                    except (RuntimeError, AttributeError):
+                                        pass  # Widget may not exist yet
+                if table_needs_rebuild:
+                    self.filename_rule_editor.template_builder._rebuild_table()
+            # Update regex once after all tokens are added
             try:
                 self.filename_rule_editor.update_regex()
             except (RuntimeError, AttributeError):
@@ -1530,9 +1774,7 @@ class RulesEditorWidget(QtWidgets.QWidget):
         if hasattr(self, 'path_rule_editor') and path_rules:
             self.path_rule_editor.base_path_edit.setText(path_rules.get('base_path', ""))
             self.path_rule_editor.rel_path_edit.setText(path_rules.get('relative_path', ""))
-            for token, value in path_rules.get('tokens', {}).items():
-                if token in self.path_rule_editor.token_controls:
-                    self.path_rule_editor.token_controls[token].setCurrentText(value)
+            self.path_rule_editor.set_token_values(path_rules.get('tokens', {}))
             idx = self.path_rule_editor.shot_struct_combo.findText(path_rules.get('shot_structure', ""))
             if idx >= 0:
                 self.path_rule_editor.shot_struct_combo.setCurrentIndex(idx)
@@ -1546,72 +1788,97 @@ class RulesEditorWidget(QtWidgets.QWidget):
             self._populate_combobox(self.fr_severity_combo, self.dropdown_options.get('severity_options'), fr_rules.get('severity'))
 
 
-        ni_rules = loaded_rules.get('node_integrity', {})
-        self.ni_check_disabled_nodes_check.setChecked(ni_rules.get('check_disabled_nodes', False))
-        self._populate_combobox(self.ni_severity_disabled_combo, self.dropdown_options.get('severity_options'), ni_rules.get('severity_disabled_nodes'))
-
-        wnr_rules = loaded_rules.get('write_node_resolution', {})
-        self.wnr_allowed_formats_edit.setText(",".join(wnr_rules.get('allowed_formats', [])))
-        self._populate_combobox(self.wnr_severity_combo, self.dropdown_options.get('severity_options'), wnr_rules.get('severity'))
-        
-        cs_rules = loaded_rules.get('colorspaces', {})
-        cs_read_rules = cs_rules.get('Read', {})
-        self.cs_read_allowed_edit.setText(",".join(cs_read_rules.get('allowed', [])))
-        self._populate_combobox(self.cs_read_severity_combo, self.dropdown_options.get('severity_options'), cs_read_rules.get('severity'))
-        
-        cs_write_rules = cs_rules.get('Write', {})
-        self.cs_write_allowed_edit.setText(",".join(cs_write_rules.get('allowed', [])))
-        self._populate_combobox(self.cs_write_severity_combo, self.dropdown_options.get('severity_options'), cs_write_rules.get('severity'))
-
-        ch_rules_data = loaded_rules.get('channels', {}) # Adjusted to load from 'channels' directly
-        self.ch_require_rgba_check.setChecked(ch_rules_data.get('require_rgba', True))
-        self.ch_warn_rgb_only_check.setChecked(ch_rules_data.get('warn_on_rgb_only', False))
-        self.ch_warn_extra_channels_check.setChecked(ch_rules_data.get('warn_on_extra_channels', False))
-        self._populate_combobox(self.ch_severity_combo, self.dropdown_options.get('severity_options'), ch_rules_data.get('severity'))
+        ni_rules = self._get_rules_section(loaded_rules, 'node_integrity')
+        if ni_rules is not None:
+            self.ni_check_disabled_nodes_check.setChecked(ni_rules.get('check_disabled_nodes', False))
+            self._populate_combobox(self.ni_severity_disabled_combo, self.dropdown_options.get('severity_options'), ni_rules.get('severity_disabled_nodes'))
 
-        rs_rules_root = loaded_rules.get('render_settings', {})
-        rs_rules_write = rs_rules_root.get('Write', {}) # Get 'Write' sub-dictionary
-        self._populate_combobox(self.rs_severity_combo, self.dropdown_options.get('severity_options'), rs_rules_write.get('severity'))
+        wnr_rules = self._get_rules_section(loaded_rules, 'write_node_resolution')
+        if wnr_rules is not None:
+            self.wnr_allowed_formats_edit.setText(",".join(wnr_rules.get('allowed_formats', [])))
+            self._populate_combobox(self.wnr_severity_combo, self.dropdown_options.get('severity_options'), wnr_rules.get('severity'))
         
-        current_selected_file_type = self._get_combobox_value(self.rs_file_type_combo)
-        if current_selected_file_type:
-            # Ensure _update_render_settings_ui is called to create widgets before trying to populate them
-            self._update_render_settings_ui(current_selected_file_type) 
+        cs_rules = self._get_rules_section(loaded_rules, 'colorspaces')
+        if cs_rules is not None:
+            cs_read_rules = cs_rules.get('Read', {})
+            self.cs_read_allowed_edit.setText(",".join(cs_read_rules.get('allowed', [])))
+            self._populate_combobox(self.cs_read_severity_combo, self.dropdown_options.get('severity_options'), cs_read_rules.get('severity'))
             
-            specific_file_rules = rs_rules_write.get('file_type_rules', {}).get(current_selected_file_type, {})
-            if hasattr(self, 'rs_dynamic_widgets'):
-                for knob_name, widget_obj in self.rs_dynamic_widgets.items():
-                    if knob_name in specific_file_rules:
-                        value_to_set = specific_file_rules[knob_name]
-                        if isinstance(widget_obj, QtWidgets.QComboBox):
-                            # Ensure widget_obj.model() is not None before calling stringList()
-                            current_items = [widget_obj.itemText(i) for i in range(widget_obj.count())] if widget_obj else []
-                            val_to_set_str = str(value_to_set[0]) if isinstance(value_to_set, list) and value_to_set else str(value_to_set)
-                            self._populate_combobox(widget_obj, current_items, val_to_set_str)
-
-
-        ver_rules = loaded_rules.get('versioning', {})
-        self.ver_require_token_check.setChecked(ver_rules.get('require_version_token', False))
-        self.ver_token_regex_edit.setText(ver_rules.get('version_token_regex', ""))
-        self._populate_combobox(self.ver_token_regex_combo, self.dropdown_options.get('versioning', {}).get('version_token_regex_examples'))
-
-        vn_rules = loaded_rules.get('viewer_nodes', {})
-        self.vn_warn_ip_active_check.setChecked(vn_rules.get('warn_if_ip_active', False))
-        self._populate_combobox(self.vn_severity_combo, self.dropdown_options.get('severity_options'), vn_rules.get('severity'))
-
-        se_rules_exp = loaded_rules.get('expressions_errors', {})
-        self.se_check_expression_errors_check.setChecked(se_rules_exp.get('check_for_errors', False))
-        self._populate_combobox(self.se_severity_expression_combo, self.dropdown_options.get('severity_options'), se_rules_exp.get('severity'))
-
-        se_rules_read = loaded_rules.get('read_file_errors', {})
-        self.se_check_read_file_existence_check.setChecked(se_rules_read.get('check_existence', False))
-        self._populate_combobox(self.se_severity_read_file_combo, self.dropdown_options.get('severity_options'), se_rules_read.get('severity'))
+            cs_write_rules = cs_rules.get('Write', {})
+            self.cs_write_allowed_edit.setText(",".join(cs_write_rules.get('allowed', [])))
+            self._populate_combobox(self.cs_write_severity_combo, self.dropdown_options.get('severity_options'), cs_write_rules.get('severity'))
+
+        ch_rules_data = self._get_rules_section(loaded_rules, 'channels') # Adjusted to load from 'channels' directly
+        if ch_rules_data is not None:
+            self.ch_require_rgba_check.setChecked(ch_rules_data.get('require_rgba', True))
+            self.ch_warn_rgb_only_check.setChecked(ch_rules_data.get('warn_on_rgb_only', False))
+            self.ch_warn_extra_channels_check.setChecked(ch_rules_data.get('warn_on_extra_channels', False))
+            self._populate_combobox(self.ch_severity_combo, self.dropdown_options.get('severity_options'), ch_rules_data.get('severity'))
+
+        rs_rules_root = self._get_rules_section(loaded_rules, 'render_settings')
+        if rs_rules_root is not None:
+            rs_rules_write = rs_rules_root.get('Write', {}) # Get 'Write' sub-dictionary
+            self._populate_combobox(self.rs_severity_combo, self.dropdown_options.get('severity_options'), rs_rules_write.get('severity'))
+            
+            current_selected_file_type = self._get_combobox_value(self.rs_file_type_combo)
+            if current_selected_file_type:
+                # Ensure _update_render_settings_ui is called to create widgets before trying to populate them
+                self._update_render_settings_ui(current_selected_file_type) 
+                
+                specific_file_rules = rs_rules_write.get('file_type_rules', {}).get(current_selected_file_type, {})
+                if hasattr(self, 'rs_dynamic_widgets'):
+                    for knob_name, widget_obj in self.rs_dynamic_widgets.items():
+                        if knob_name in specific_file_rules:
+                            value_to_set = specific_file_rules[knob_name]
+                            if isinstance(widget_obj, QtWidgets.QComboBox):
+                                # Ensure widget_obj.model() is not None before calling stringList()
+                                current_items = [widget_obj.itemText(i) for i in range(widget_obj.count())] if widget_obj else []
+                                val_to_set_str = str(value_to_set[0]) if isinstance(value_to_set, list) and value_to_set else str(value_to_set)
+                                self._populate_combobox(widget_obj, current_items, val_to_set_str)
+
+
+        ver_rules = self._get_rules_section(loaded_rules, 'versioning')
+        if ver_rules is not None:
+            self.ver_require_token_check.setChecked(ver_rules.get('require_version_token', False))
+            self.ver_token_regex_edit.setText(ver_rules.get('version_token_regex', ""))
+            self._populate_combobox(self.ver_token_regex_combo, self.dropdown_options.get('versioning', {}).get('version_token_regex_examples'))
+
+        vn_rules = self._get_rules_section(loaded_rules, 'viewer_nodes')
+        if vn_rules is not None:
+            self.vn_warn_ip_active_check.setChecked(vn_rules.get('warn_if_ip_active', False))
+            self._populate_combobox(self.vn_severity_combo, self.dropdown_options.get('severity_options'), vn_rules.get('severity'))
+
+        se_rules_exp = self._get_rules_section(loaded_rules, 'expressions_errors')
+        if se_rules_exp is not None:
+            self.se_check_expression_errors_check.setChecked(se_rules_exp.get('check_for_errors', False))
+            self._populate_combobox(self.se_severity_expression_combo, self.dropdown_options.get('severity_options'), se_rules_exp.get('severity'))
+
+        se_rules_read = self._get_rules_section(loaded_rules, 'read_file_errors')
+        if se_rules_read is not None:
+            self.se_check_read_file_existence_check.setChecked(se_rules_read.get('check_existence', False))
+            self._populate_combobox(self.se_severity_read_file_combo, self.dropdown_options.get('severity_options'), se_rules_read.get('severity'))
         
         print(f"Rules loaded from {self.rules_yaml_path} ({self.current_yaml_name})")
 
+    def _get_rules_section(self, loaded_rules, key):
+        """ Returns the rules dict for a section, or None when loading it can be skipped.
+        
+        A section missing from the file is skipped if no earlier load applied it, since the
+        widgets still hold their init defaults. If an earlier file did apply it, an empty dict
+        is returned so the widgets are reset to the defaults.
+        """
+        section = loaded_rules.get(key)
+        if section:
+            self._applied_rule_sections.add(key)
+            return section
+        if key in self._applied_rule_sections:
+            self._applied_rule_sections.discard(key)
+            return {}
+        return None
+
     def _on_save_as_new_yaml(self):
         """Save current rules to a new YAML file"""
-        dir_path = os.path.dirname(os.path.abspath(__file__))
+        dir_path = _SCRIPT_DIR
         path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save New Rules YAML", dir_path, "YAML Files (*.yaml)")
         if path:
             # Save current rules to new YAML
@@ -1621,23 +1888,24 @@ class RulesEditorWidget(QtWidgets.QWidget):
             self.save_rules_to_yaml()
             
             # Notify parent (main window) about the new YAML file if possible
-            # Try to find the main window parent that has refresh_yaml_selector attribute
-            main_window = None
+            # Reuse the window found on a previous call before walking the hierarchy again
+            main_window = getattr(self, '_main_window', None)
             
             # First try the explicitly stored parent
-            if hasattr(self, 'main_window_parent') and self.main_window_parent and hasattr(self.main_window_parent, 'refresh_yaml_selector'):
+            if main_window is None and getattr(self.main_window_parent, 'refresh_yaml_selector', None) is not None:
                 main_window = self.main_window_parent
             
             # If that fails, try the Qt parent hierarchy
-            if not main_window:
+            if main_window is None:
                 temp_parent = self.parent()
                 while temp_parent:
-                    if hasattr(temp_parent, 'refresh_yaml_selector'):
+                    if getattr(temp_parent, 'refresh_yaml_selector', None) is not None:
                         main_window = temp_parent
                         break
                     temp_parent = temp_parent.parent()
                 
             if main_window:
+                self._main_window = main_window
                 main_window.refresh_yaml_selector()
                 # Set the new YAML as selected
                 yaml_name = os.path.basename(path)
@@ -1658,33 +1926,31 @@ class RulesEditorWidget(QtWidgets.QWidget):
 
         if not file_type or not self.dropdown_options: return
 
-        file_type_specific_options = self.dropdown_options.get('render_settings', {}).get(file_type, {})
-        
         if file_type == "exr":
             self.rs_exr_datatype_combo = QtWidgets.QComboBox()
-            self._populate_combobox(self.rs_exr_datatype_combo, file_type_specific_options.get('datatype_options'))
+            self._populate_combobox(self.rs_exr_datatype_combo, self._rs_exr_datatype)
             self.rs_dynamic_settings_layout.addRow("EXR Datatype:", self.rs_exr_datatype_combo)
             self.rs_dynamic_widgets['datatype'] = self.rs_exr_datatype_combo
 
             self.rs_exr_compression_combo = QtWidgets.QComboBox()
-            self._populate_combobox(self.rs_exr_compression_combo, file_type_specific_options.get('compression_options'))
+            self._populate_combobox(self.rs_exr_compression_combo, self._rs_exr_compression)
             self.rs_dynamic_settings_layout.addRow("EXR Compression:", self.rs_exr_compression_combo)
             self.rs_dynamic_widgets['compression'] = self.rs_exr_compression_combo
 
         elif file_type == "mov":
             self.rs_mov_codec_combo = QtWidgets.QComboBox()
-            self._populate_combobox(self.rs_mov_codec_combo, file_type_specific_options.get('codec_options'))
+            self._populate_combobox(self.rs_mov_codec_combo, self._rs_mov_codec)
             self.rs_dynamic_settings_layout.addRow("MOV Codec:", self.rs_mov_codec_combo)
             self.rs_dynamic_widgets['codec'] = self.rs_mov_codec_combo
             
         elif file_type == "jpg":
             self.rs_jpg_quality_combo = QtWidgets.QComboBox() 
-            self._populate_combobox(self.rs_jpg_quality_combo, file_type_specific_options.get('_jpeg_quality_options'))
+            self._populate_combobox(self.rs_jpg_quality_combo, self._rs_jpg_quality)
             self.rs_dynamic_settings_layout.addRow("JPG Quality:", self.rs_jpg_quality_combo)
             self.rs_dynamic_widgets['_jpeg_quality'] = self.rs_jpg_quality_combo
             
             self.rs_jpg_sub_sampling_combo = QtWidgets.QComboBox()
-            self._populate_combobox(self.rs_jpg_sub_sampling_combo, file_type_specific_options.get('_jpeg_sub_sampling_options'))
+            self._populate_combobox(self.rs_jpg_sub_sampling_combo, self._rs_jpg_sub_sampling)
             self.rs_dynamic_settings_layout.addRow("JPG Sub-sampling:", self.rs_jpg_sub_sampling_combo)
             self.rs_dynamic_widgets['_jpeg_sub_sampling'] = self.rs_jpg_sub_sampling_combo
 
@@ -1744,7 +2010,7 @@ class PathRuleEditor(QtWidgets.QWidget):
         layout.addLayout(shot_struct_layout)
         # Token-based relative path builder
         self.token_controls = {}
-        self.rel_path_tokens = ["<shot_name>", "<resolution>", "<version>"]
+        self.rel_path_tokens = [_SHOT_TOKEN, _RES_TOKEN, _VER_TOKEN]
         rel_path_tokens_layout = QtWidgets.QHBoxLayout()
         rel_path_tokens_layout.addWidget(QtWidgets.QLabel("Tokens:"))
         for token in self.rel_path_tokens:
@@ -1804,6 +2070,12 @@ class PathRuleEditor(QtWidgets.QWidget):
             rel_path_tokens_layout.addWidget(QtWidgets.QLabel(token))
             rel_path_tokens_layout.addWidget(combo)
             combo.currentTextChanged.connect(self.update_preview)
+        # Case-insensitive lookup of resolution entries for autofill_tokens_from_script
+        self._resolution_lookup = {}
+        res_combo = self.token_controls.get(_RES_TOKEN)
+        if res_combo is not None:
+            for i in range(res_combo.count()):
+                self._resolution_lookup.setdefault(res_combo.itemText(i).upper(), res_combo.itemText(i))
         autofill_btn = QtWidgets.QPushButton("Auto-fill from Script")
         autofill_btn.setToolTip("Auto-fill tokens from the current Nuke script name.")
         autofill_btn.clicked.connect(self.autofill_tokens_from_script)
@@ -1902,8 +2174,8 @@ class PathRuleEditor(QtWidgets.QWidget):
         self.update_preview()
     def autofill_tokens_from_script(self):
         # Parse tokens from current Nuke script filename
-        import nuke
-        import os
+        if nuke is None:
+            return
         script_path = nuke.root().name()
         
         if not script_path:
@@ -1912,20 +2184,22 @@ class PathRuleEditor(QtWidgets.QWidget):
         # Extract just the filename (without path and extension)
         filename = os.path.splitext(os.path.basename(script_path))[0]
         
+        # Collected here and applied in one batch below
+        token_values = {}
+        
         # Shot name: everything before the first underscore
         # Example: "KITC0010_description_comp_LL180_v011" -> "KITC0010"
         if "_" in filename:
             shot_name = filename.split("_")[0]
-            if shot_name and "<shot_name>" in self.token_controls:
-                self.token_controls["<shot_name>"].setCurrentText(shot_name)
+            if shot_name:
+                token_values[_SHOT_TOKEN] = shot_name
         
         # Version: find vXXX pattern anywhere in filename
         # Example: "v011" -> "v011"
-        import re
         version_match = re.search(r'v(\d{2,4})', filename, re.IGNORECASE)
-        if version_match and "<version>" in self.token_controls:
+        if version_match:
             version = f"v{version_match.group(1).zfill(3)}"  # Ensure 3 digits: v011
-            self.token_controls["<version>"].setCurrentText(version)
+            token_values[_VER_TOKEN] = version
         
         # Resolution: find resolution pattern (e.g., 2K, 4K, HD_1080, etc.)
         # Example: "LL180", "2K", "4K", "HD_1080"
@@ -1938,18 +2212,34 @@ class PathRuleEditor(QtWidgets.QWidget):
         
         for pattern in resolution_patterns:
             res_match = re.search(pattern, filename, re.IGNORECASE)
-            if res_match and "<resolution>" in self.token_controls:
+            if res_match and _RES_TOKEN in self.token_controls:
                 resolution = res_match.group(1)
                 # Check if this resolution exists in the dropdown
-                combo = self.token_controls["<resolution>"]
-                for i in range(combo.count()):
-                    if combo.itemText(i).upper() == resolution.upper():
-                        combo.setCurrentText(combo.itemText(i))
-                        break
+                match_text = self._resolution_lookup.get(resolution.upper())
+                if match_text is not None:
+                    token_values[_RES_TOKEN] = match_text
                 break  # Stop after first match
         
+        self.set_token_values(token_values)
         # Update the preview after auto-filling
         self.update_preview()
+
+    def set_token_values(self, token_values):
+        """ Sets several token combos at once without a preview update per combo.
+        
+        Signals are blocked on each combo while its text is set, so callers should
+        call update_preview() once afterwards.
+        
+        Args:
+            token_values (dict): Mapping of token (e.g. "<version>") to the text to set.
+        """
+        for token, value in token_values.items():
+            combo = self.token_controls.get(token)
+            if combo is None:
+                continue
+            combo.blockSignals(True)
+            combo.setCurrentText(value)
+            combo.blockSignals(False)
     def copy_preview_to_clipboard(self):
         QtWidgets.QApplication.clipboard().setText(self.preview_edit.text())
     def show_help_dialog(self):
@@ -1965,7 +2255,6 @@ class PathRuleEditor(QtWidgets.QWidget):
 The resolved path preview updates live as you edit.<br>
             """)
     def save_template(self):
-        import yaml
         config = {
             "base_path": self.base_path_edit.text(),
             "shot_structure": self.shot_struct_combo.currentText(),
@@ -1976,25 +2265,21 @@ The resolved path preview updates live as you edit.<br>
         if path:
             with open(path, "w") as f:
                 if path.endswith(".json"):
-                    import json
                     json.dump(config, f, indent=2)
                 else:
-                    yaml.dump(config, f, sort_keys=False)
+                    yaml.dump(config, f, Dumper=_YDumper, sort_keys=False)
     def load_template(self):
-        import yaml
         path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Load Path Template", "", "YAML Files (*.yaml);;JSON Files (*.json)")
         if path:
-            with open(path, "r") as f:
+            # Binary mode lets json detect the encoding and libyaml read the raw stream
+            with open(path, "rb") as f:
                 if path.endswith(".json"):
-                    import json
                     config = json.load(f)
                 else:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=_YLoader)
             self.base_path_edit.setText(config.get("base_path", ""))
             self.rel_path_edit.setText(config.get("relative_path", ""))
-            for token, value in config.get("tokens", {}).items():
-                if token in self.token_controls:
-                    self.token_controls[token].setCurrentText(value)
+            self.set_token_values(config.get("tokens", {}))
             idx = self.shot_struct_combo.findText(config.get("shot_structure", ""))
             if idx >= 0:
                 self.shot_struct_combo.setCurrentIndex(idx)
@@ -2002,10 +2287,55 @@ The resolved path preview updates live as you edit.<br>
 
     # Debug method removed to resolve AttributeError
 
+@functools.lru_cache(maxsize=None)
+def _separator_list_model():
+    """Return the QStringListModel of SEPARATOR_OPTIONS shared by all separator combos.
+    
+    Built on first use, once the QApplication exists, and parented to it.
+    """
+    return QtCore.QStringListModel(SEPARATOR_OPTIONS, QtWidgets.QApplication.instance())
+
+def _control_value_reader(control):
+    """Return the bound method that reads a token control's value, or None for static tokens."""
+    if isinstance(control, QtWidgets.QSpinBox):
+        return control.value
+    if isinstance(control, QtWidgets.QComboBox):
+        return control.currentText
+    if isinstance(control, SimpleMultiSelectWidget):
+        return control.get_selected_values
+    return None
+
+# Widgets a template builder's clear() keeps per token name for the next preset to reuse;
+# any more are deleted, so switching between presets can't grow the pool without bound
+_TOKEN_WIDGET_POOL_SIZE = 2
+
+def _park_token_widget(pool, widget):
+    """Hide widget and keep it in pool (token name -> widgets), or delete it if that name's list is full."""
+    parked = pool.setdefault(widget.token_def["name"], [])
+    if len(parked) < _TOKEN_WIDGET_POOL_SIZE:
+        widget.hide()
+        parked.append(widget)
+    else:
+        widget.deleteLater()
+
+def _take_pooled_token_widget(pool, token_def):
+    """Return a widget parked for this token definition, reset to defaults, or None."""
+    parked = pool.get(token_def["name"])
+    if parked:
+        for i, widget in enumerate(parked):
+            if widget.token_def == token_def:
+                del parked[i]
+                widget.reset()
+                return widget
+    return None
+
 class SimpleTokenWidget(QtWidgets.QWidget):
     """
     Simple token widget with horizontal layout for the new interface
     """
+    # Emitted when the value or separator changes; the builder connects it in add_token
+    templateChanged = QtCore.Signal()
+    
     def __init__(self, token_def, parent=None):
         super().__init__(parent)
         self.token_def = token_def
@@ -2018,13 +2348,7 @@ class SimpleTokenWidget(QtWidgets.QWidget):
         # Column 1: Token label (fixed width)
         self.label = QtWidgets.QLabel(token_def["label"])
         self.label.setFixedWidth(120)
-        self.label.setStyleSheet("""
-            QLabel {
-                color: #e0e0e0;
-                font-size: 11px;
-                padding: 2px 4px;
-            }
-        """)
+        self.label.setStyleSheet(_TOKEN_LABEL_QSS)
         layout.addWidget(self.label)
         
         # Column 2: Control (dropdown, multiselect, spinner, etc.)
@@ -2055,34 +2379,12 @@ class SimpleTokenWidget(QtWidgets.QWidget):
             self.control.setStyleSheet("QLabel { color: #888; font-style: italic; }")
         
         if self.control:
-            self.control.setStyleSheet("""
-                QWidget {
-                    background: #3a3a3a;
-                    color: #e0e0e0;
-                    border: 1px solid #555;
-                    border-radius: 3px;
-                    padding: 2px 4px;
-                    font-size: 11px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    width: 16px;
-                }
-                QComboBox::down-arrow {
-                    image: none;
-                    border-left: 3px solid transparent;
-                    border-right: 3px solid transparent;
-                    border-top: 3px solid #e0e0e0;
-                }
-                QComboBox QAbstractItemView {
-                    background: #3a3a3a;
-                    color: #e0e0e0;
-                    selection-background-color: #4a9eff;
-                }
-            """)
+            self.control.setStyleSheet(_TOKEN_CONTROL_QSS)
             layout.addWidget(self.control)
         else:
             layout.addWidget(QtWidgets.QLabel(""))
+        # Picked once here so get_token_config doesn't re-check the control type per call
+        self._read_value = _control_value_reader(self.control)
         
         # Column 3: Up/Down arrows
         arrows_layout = QtWidgets.QVBoxLayout()
@@ -2091,33 +2393,11 @@ class SimpleTokenWidget(QtWidgets.QWidget):
         
         self.up_btn = QtWidgets.QPushButton("▲")
         self.up_btn.setFixedSize(20, 12)
-        self.up_btn.setStyleSheet("""
-            QPushButton {
-                background: #4a4a4a;
-                color: #e0e0e0;
-                border: 1px solid #666;
-                border-radius: 2px;
-                font-size: 8px;
-                padding: 0px;
-            }
-            QPushButton:hover { background: #5a5a5a; }
-            QPushButton:pressed { background: #2a2a2a; }
-        """)
+        self.up_btn.setStyleSheet(_ARROW_BTN_QSS)
         
         self.down_btn = QtWidgets.QPushButton("▼")
         self.down_btn.setFixedSize(20, 12)
-        self.down_btn.setStyleSheet("""
-            QPushButton {
-                background: #4a4a4a;
-                color: #e0e0e0;
-                border: 1px solid #666;
-                border-radius: 2px;
-                font-size: 8px;
-                padding: 0px;
-            }
-            QPushButton:hover { background: #5a5a5a; }
-            QPushButton:pressed { background: #2a2a2a; }
-        """)
+        self.down_btn.setStyleSheet(_ARROW_BTN_QSS)
         
         arrows_layout.addWidget(self.up_btn)
         arrows_layout.addWidget(self.down_btn)
@@ -2125,57 +2405,22 @@ class SimpleTokenWidget(QtWidgets.QWidget):
         
         # Column 4: Separator dropdown
         self.separator_combo = QtWidgets.QComboBox()
-        self.separator_combo.addItems(["_", ".", "-", " ", "(none)"])
+        self.separator_combo.setModel(_separator_list_model())
         self.separator_combo.setCurrentText("_")  # Default separator
         self.separator_combo.setFixedWidth(60)
-        self.separator_combo.setStyleSheet("""
-            QComboBox {
-                background: #3a3a3a;
-                color: #e0e0e0;
-                border: 1px solid #555;
-                border-radius: 3px;
-                padding: 2px 4px;
-                font-size: 11px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 16px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 3px solid transparent;
-                border-right: 3px solid transparent;
-                border-top: 3px solid #e0e0e0;
-            }
-            QComboBox QAbstractItemView {
-                background: #3a3a3a;
-                color: #e0e0e0;
-                selection-background-color: #4a9eff;
-            }
-        """)
+        self.separator_combo.setStyleSheet(_SEPARATOR_COMBO_QSS)
         layout.addWidget(self.separator_combo)
         
         # Remove button
         self.remove_btn = QtWidgets.QPushButton("×")
         self.remove_btn.setFixedSize(20, 20)
-        self.remove_btn.setStyleSheet("""
-            QPushButton {
-                background: #d32f2f;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background: #f44336; }
-            QPushButton:pressed { background: #b71c1c; }
-        """)
+        self.remove_btn.setStyleSheet(_REMOVE_BTN_QSS)
         layout.addWidget(self.remove_btn)
         
         # Connect signals
-        if self.control and hasattr(self.control, 'currentTextChanged'):
+        if isinstance(self.control, QtWidgets.QComboBox):
             self.control.currentTextChanged.connect(self._on_control_changed)
-        elif self.control and hasattr(self.control, 'valueChanged'):
+        elif isinstance(self.control, QtWidgets.QSpinBox):
             self.control.valueChanged.connect(self._on_control_changed)
         
         self.separator_combo.currentTextChanged.connect(self._on_control_changed)
@@ -2185,28 +2430,29 @@ class SimpleTokenWidget(QtWidgets.QWidget):
         self.setFixedHeight(30)
         
     def _on_control_changed(self):
-        """Notify parent when control values change"""
-        parent = self.parent()
-        while parent:
-            if hasattr(parent, 'update_regex'):
-                parent.update_regex()
-                break
-            parent = parent.parent()
+        """Notify the builder when control values change"""
+        self.templateChanged.emit()
+    
+    def reset(self):
+        """Put the control and separator back to their defaults without emitting templateChanged."""
+        self.blockSignals(True)
+        try:
+            if isinstance(self.control, QtWidgets.QSpinBox):
+                self.control.setValue(self.token_def["default"])
+            elif isinstance(self.control, QtWidgets.QComboBox):
+                self.control.setCurrentIndex(0)
+            elif isinstance(self.control, SimpleMultiSelectWidget):
+                self.control.set_selected_values([])
+            self.separator_combo.setCurrentText("_")
+        finally:
+            self.blockSignals(False)
     
     def get_token_config(self):
         """Return the token configuration"""
         value = None
-        if self.control:
+        if self._read_value is not None:
             try:
-                if isinstance(self.control, QtWidgets.QSpinBox):
-                    value = self.control.value()
-                elif isinstance(self.control, QtWidgets.QComboBox):
-                    value = self.control.currentText()
-                elif isinstance(self.control, SimpleMultiSelectWidget):
-                    value = self.control.get_selected_values()
-                    print(f"MULTISELECT SAVE DEBUG: Token {self.token_def['name']}")
-                    print(f"  Saving value: {value} (type: {type(value)})")
-                    print("---")
+                value = self._read_value()
             except RuntimeError:
                 value = None
         
@@ -2221,131 +2467,387 @@ class SimpleTokenWidget(QtWidgets.QWidget):
             "separator": separator
         }
 
-class ValidationResultsTable(QtWidgets.QTableWidget):
+def _translucent_color(hex_color, alpha):
+    """Return a QColor for hex_color with the given alpha (0-255)."""
+    color = QtGui.QColor(hex_color)
+    color.setAlpha(alpha)
+    return color
+
+class ValidationResultsModel(QtCore.QAbstractTableModel):
     """
-    Excel-like table for displaying validation results with resizable columns.
-    
-    This specialized table widget provides a standardized interface for presenting
-    validation results from the Nuke Validator. It handles different result types
-    (success, warning, error) with appropriate styling and provides interactive
-    elements like "Go to Node" buttons for navigation.
+    Table model holding the rows shown by ValidationResultsTable.
     
-    Features:
-        - Status icons with color coding for success/warning/error states
-        - Resizable columns with optimal default sizes
-        - Support for "Go to Node" action buttons
-        - Consistent Nuke-themed styling
-        - Row background highlighting based on result severity
+    Results are stored column-wise in four parallel lists (statuses, rules, details,
+    nodes), so work on one column such as sorting by status only touches that list.
+    The status icon, row tint and "Go to Node" cell are produced on demand in data(),
+    so no per-cell items or widgets are created.
     
-    Methods:
-        add_validation_result: Add a new validation result row to the table
-        clear_results: Remove all results from the table
-        get_selected_rule: Retrieve the currently selected rule name
+    Columns:
+        0 - Status pixmap (DecorationRole)
+        1 - Rule name
+        2 - Details (editable so the text can be selected and copied)
+        3 - Action ("Go to Node" when the row has a node)
     """
-    def __init__(self, parent=None, available_tokens=None):
-        super().__init__(parent)
-        
-        # Set up table structure
-        self.setColumnCount(4)
-        self.setHorizontalHeaderLabels(["Status", "Rule", "Details", "Action"])
-        
+    HEADERS = ["Status", "Rule", "Details", "Action"]
+    
+    STATUS_ICON_FILES = _STATUS_ICON_FILES
+    STATUS_COLORS = _STATUS_COLORS
+    
+    # Very transparent row tints, built once when the class is defined
+    _ROW_BG_COLORS = {name: _translucent_color(color, 0x20) for name, color in STATUS_COLORS.items()}
+    
+    # Scaled status pixmaps keyed by (status, size), also used by other widgets' status labels.
+    # Filled on first use because pixmaps need a QApplication
+    _PIXMAP_CACHE: Dict[tuple, QtGui.QPixmap] = {}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._statuses = []
+        self._rules = []
+        self._details = []
+        self._nodes = []
+    
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._statuses)
+    
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == 2:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
+            if column == 1:
+                return self._rules[row]
+            if column == 2:
+                return self._details[row]
+            if column == 3 and self._nodes[row]:
+                return "Go to Node"
+            return None
+        if role == Qt.ItemDataRole.DecorationRole:
+            if column == 0:
+                return self.get_status_pixmap(self._statuses[row])
+            return None
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if column == 1:
+                return self._rules[row]
+            if column == 2:
+                return "Double-click to select/copy this text: " + self._details[row]
+            if column == 3 and self._nodes[row]:
+                return f"Select and focus on {self._nodes[row]}"
+            return None
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._row_background(self._statuses[row])
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        # The details editor only exists for selecting/copying; results stay unchanged
+        return False
+    
+    def add_result(self, status, rule_name, details, node_name=None):
+        """Append one result row and return its row index."""
+        row = len(self._statuses)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._statuses.append(status)
+        self._rules.append(rule_name)
+        self._details.append(details)
+        self._nodes.append(node_name)
+        self.endInsertRows()
+        return row
+    
+    def add_results(self, results):
+        """Append several results with a single row-insert notification.
+        
+        Args:
+            results (list): (status, rule_name, details, node_name) tuples.
+        
+        Returns:
+            range: Row indices of the added results.
+        """
+        first = len(self._statuses)
+        if not results:
+            return range(first, first)
+        last = first + len(results) - 1
+        self.beginInsertRows(QtCore.QModelIndex(), first, last)
+        for status, rule_name, details, node_name in results:
+            self._statuses.append(status)
+            self._rules.append(rule_name)
+            self._details.append(details)
+            self._nodes.append(node_name)
+        self.endInsertRows()
+        return range(first, last + 1)
+    
+    def clear(self):
+        """Remove all result rows."""
+        self.beginResetModel()
+        self._statuses = []
+        self._rules = []
+        self._details = []
+        self._nodes = []
+        self.endResetModel()
+    
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort rows by one column; the permutation is computed from that column's list only."""
+        key_lists = {0: self._statuses, 1: self._rules, 2: self._details, 3: self._nodes}
+        keys = key_lists.get(column)
+        if keys is None:
+            return
+        self.layoutAboutToBeChanged.emit()
+        # Nodes may be None; sort those as empty strings
+        key = keys.__getitem__ if column != 3 else (lambda i: keys[i] or "")
+        order_index = sorted(range(len(keys)), key=key, reverse=(order == Qt.SortOrder.DescendingOrder))
+        self._statuses = [self._statuses[i] for i in order_index]
+        self._rules = [self._rules[i] for i in order_index]
+        self._details = [self._details[i] for i in order_index]
+        self._nodes = [self._nodes[i] for i in order_index]
+        # Keep selection/current index on the same results after the reorder
+        new_rows = {old_row: new_row for new_row, old_row in enumerate(order_index)}
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(persistent, [self.index(new_rows[i.row()], i.column()) for i in persistent])
+        self.layoutChanged.emit()
+    
+    def rule_at(self, row):
+        """Return the rule name stored for a row."""
+        return self._rules[row]
+    
+    def details_at(self, row):
+        """Return the details text stored for a row."""
+        return self._details[row]
+    
+    def node_at(self, row):
+        """Return the node name stored for a row, or None."""
+        return self._nodes[row]
+    
+    def _row_background(self, status):
+        """Very transparent tint of the status color, shared by every row with that status"""
+        return self._ROW_BG_COLORS.get(status, self._ROW_BG_COLORS['pending'])
+    
+    @classmethod
+    def get_status_pixmap(cls, status, size=20):
+        """Return the status pixmap scaled to size, loading it only on the first request.
+        
+        Unknown statuses get the pending pixmap.
+        """
+        if status not in cls.STATUS_ICON_FILES:
+            status = 'pending'
+        key = (status, size)
+        pixmap = cls._PIXMAP_CACHE.get(key)
+        if pixmap is None:
+            pixmap = cls._create_status_pixmap(status, size)
+            cls._PIXMAP_CACHE[key] = pixmap
+        return pixmap
+    
+    @classmethod
+    def _create_status_pixmap(cls, status, size=20):
+        """Load the PNG icon for a status, falling back to a colored circle"""
+        # Try to load PNG icons first
+        icon_file = cls.STATUS_ICON_FILES.get(status, 'info.png')
+        
+        if icon_file in _ICONS_PRESENT:
+            pixmap = QtGui.QPixmap(os.path.join(_ICONS_DIR, icon_file))
+            if not pixmap.isNull():
+                return pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        
+        # Fallback to colored circles
+        color = _STATUS_FALLBACK_COLORS.get(status, _STATUS_FALLBACK_COLORS['pending'])
+        pixmap = QtGui.QPixmap(size, size)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setBrush(QtGui.QBrush(color))
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        painter.drawEllipse(2, 2, size - 4, size - 4)
+        painter.end()
+        
+        return pixmap
+
+class _StatusIconDelegate(QtWidgets.QStyledItemDelegate):
+    """Draws the cached status pixmap centered in its cell."""
+    def paint(self, painter, option, index):
+        # Background and selection from the base item, without its decoration
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.features &= ~QtWidgets.QStyleOptionViewItem.ViewItemFeature.HasDecoration
+        opt.icon = QtGui.QIcon()
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+        
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if pixmap is not None:
+            painter.drawPixmap(option.rect.center() - QtCore.QPoint(pixmap.width() // 2, pixmap.height() // 2), pixmap)
+
+class _GoToNodeDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints the "Go to Node" button for rows that have a node and handles its clicks,
+    replacing a QPushButton cell widget per row.
+    """
+    BUTTON_SIZE = QtCore.QSize(80, 20)
+    
+    # Paint resources, shared by every cell; see _button_brush()
+    _BORDER_COLOR = QtGui.QColor("#666666")
+    _HOVER_BORDER_COLOR = QtGui.QColor("#777777")
+    _TEXT_COLOR = QtGui.QColor("#e0e0e0")
+    _button_brushes = {}
+    
+    @classmethod
+    def _button_brush(cls, hovered):
+        """Vertical gradient brush for the button, built once per hover state.
+        
+        ObjectBoundingMode stretches the gradient over whatever rect is drawn, so one
+        brush serves every row.
+        """
+        brush = cls._button_brushes.get(hovered)
+        if brush is None:
+            gradient = QtGui.QLinearGradient(0, 0, 0, 1)
+            gradient.setCoordinateMode(QtGui.QGradient.CoordinateMode.ObjectBoundingMode)
+            gradient.setColorAt(0, QtGui.QColor("#5a5a5a" if hovered else "#4a4a4a"))
+            gradient.setColorAt(1, QtGui.QColor("#4a4a4a" if hovered else "#3a3a3a"))
+            brush = QtGui.QBrush(gradient)
+            cls._button_brushes[hovered] = brush
+        return brush
+    
+    def __init__(self, on_clicked, parent=None):
+        super().__init__(parent)
+        self._on_clicked = on_clicked
+    
+    def _button_rect(self, cell_rect):
+        rect = QtCore.QRect(QtCore.QPoint(0, 0), self.BUTTON_SIZE)
+        rect.moveCenter(cell_rect.center())
+        return rect
+    
+    def paint(self, painter, option, index):
+        # Row tint and selection come from the base delegate; the button text is drawn below
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+        
+        label = index.data(Qt.ItemDataRole.DisplayRole)
+        if not label:
+            return
+        
+        rect = self._button_rect(option.rect)
+        hovered = bool(option.state & QtWidgets.QStyle.StateFlag.State_MouseOver)
+        
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setBrush(self._button_brush(hovered))
+        painter.setPen(self._HOVER_BORDER_COLOR if hovered else self._BORDER_COLOR)
+        painter.drawRoundedRect(QtCore.QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+        
+        font = QtGui.QFont(option.font)
+        font.setPixelSize(9)
+        painter.setFont(font)
+        painter.setPen(self._TEXT_COLOR)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QtCore.QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            node_name = model.node_at(index.row())
+            if node_name and self._button_rect(option.rect).contains(event.position().toPoint()):
+                self._on_clicked(node_name)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+class ValidationResultsTable(QtWidgets.QTableView):
+    """
+    Excel-like table for displaying validation results with resizable columns.
+    
+    This specialized table view provides a standardized interface for presenting
+    validation results from the Nuke Validator. It handles different result types
+    (success, warning, error) with appropriate styling and provides interactive
+    elements like "Go to Node" buttons for navigation.
+    
+    Results are stored in a ValidationResultsModel; status icons and "Go to Node"
+    buttons are painted by delegates, so adding a row creates no widgets.
+    
+    Features:
+        - Status icons with color coding for success/warning/error states
+        - Resizable columns with optimal default sizes
+        - Support for "Go to Node" action buttons
+        - Consistent Nuke-themed styling
+        - Row background highlighting based on result severity
+    
+    Methods:
+        add_validation_result: Add a new validation result row to the table
+        clear_results: Remove all results from the table
+        get_selected_rule: Retrieve the currently selected rule name
+    """
+    def __init__(self, parent=None, available_tokens=None):
+        super().__init__(parent)
+        
+        # Set up table structure
+        self.results_model = ValidationResultsModel(self)
+        self.setModel(self.results_model)
+        self.setItemDelegateForColumn(0, _StatusIconDelegate(self))
+        self.setItemDelegateForColumn(3, _GoToNodeDelegate(self._go_to_node, self))
+        self.setMouseTracking(True)  # Hover highlight on the painted buttons
+        
+        # begin_batch()/end_batch() nesting depth and the sorting state to restore
+        self._batch_depth = 0
+        self._batch_sorting = False
+        # Results from add_validation_result waiting for the next event-loop pass
+        self._pending_results = []
+        self._flush_scheduled = False
+        
         # Configure table behavior
         self.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
-        self.setAlternatingRowColors(True)
+        # No alternating rows: every row already carries its status tint (BackgroundRole)
         self.setSortingEnabled(False)
-        self.setWordWrap(True)
+        # Single-line rows: long details are elided and shown in full via tooltip or
+        # get_selected_details(), so Qt never lays out wrapped text to size rows
+        self.setWordWrap(False)
+        self.setTextElideMode(Qt.TextElideMode.ElideRight)
         
         # Configure headers
         header = self.horizontalHeader()
         header.setStretchLastSection(False)
         header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Fixed)  # Status icon - fixed
-        header.setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)  # Rule - auto-size
+        header.setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeMode.Fixed)  # Rule - fixed, long names elided
         header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeMode.Stretch)  # Details - takes remaining space
         header.setSectionResizeMode(3, QtWidgets.QHeaderView.ResizeMode.Fixed)  # Action button - fixed
         
         # Set column widths
         self.setColumnWidth(0, 40)   # Status icon
-        self.setColumnWidth(1, 150)  # Rule name
+        self.setColumnWidth(1, 180)  # Rule name (full name in tooltip)
         self.setColumnWidth(3, 100)  # Action button
         
         # Vertical header
         self.verticalHeader().setVisible(False)
         self.verticalHeader().setDefaultSectionSize(28)  # Row height
+        self.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
         
-        # Apply Nuke dark theme styling
+        # Apply Nuke dark theme styling; header and scroll bar rules come from the
+        # window's sheet (see MainWindow), so only the view itself is styled here
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #393939;
-                alternate-background-color: #333333;
                 color: #e0e0e0;
                 gridline-color: #555555;
                 border: 1px solid #555555;
                 selection-background-color: #4a4a4a;
+                selection-color: #ffffff;
                 font-size: 11px;
             }
-            
-            QTableWidget::item {
-                border: none;
-                padding: 4px 6px;
-                background: transparent;
-            }
-            
-            QTableWidget::item:selected {
-                background-color: #4a4a4a;
-                color: #ffffff;
-            }
-            
-            QHeaderView::section {
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                border: 1px solid #555555;
-                border-left: none;
-                border-right: 1px solid #555555;
-                border-top: none;
-                border-bottom: 1px solid #555555;
-                padding: 4px 8px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            
-            QHeaderView::section:first {
-                border-left: 1px solid #555555;
-            }
-            
-            QScrollBar:vertical {
-                background: #2a2a2a;
-                border: 1px solid #555555;
-                width: 16px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background: #4a4a4a;
-                border: 1px solid #666666;
-                border-radius: 3px;
-                min-height: 20px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background: #5a5a5a;
-            }
-            
-            QScrollBar:horizontal {
-                background: #2a2a2a;
-                border: 1px solid #555555;
-                height: 16px;
-            }
-            
-            QScrollBar::handle:horizontal {
-                background: #4a4a4a;
-                border: 1px solid #666666;
-                border-radius: 3px;
-                min-width: 20px;
-            }
-            
-            QScrollBar::handle:horizontal:hover {
-                background: #5a5a5a;
-            }
         """)
     
     def add_validation_result(self, rule_name, status, details, node_name=None):
@@ -2357,159 +2859,89 @@ class ValidationResultsTable(QtWidgets.QTableWidget):
             status (str): 'success', 'warning', 'error', 'running', 'pending'
             details (str): Detailed explanation of the result
             node_name (str): Optional node name for "Go to Node" button
-        """
-        row = self.rowCount()
-        self.insertRow(row)
-        
-        # Column 0: Status icon
-        status_widget = self._create_status_widget(status)
-        self.setCellWidget(row, 0, status_widget)
-        
-        # Column 1: Rule name
-        rule_item = QtWidgets.QTableWidgetItem(rule_name)
-        rule_item.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable)
-        rule_item.setToolTip(rule_name)
-        self.setItem(row, 1, rule_item)
-        
-        # Column 2: Details with word wrapping - explicitly make text selectable and copyable
-        details_item = QtWidgets.QTableWidgetItem(details)
-        details_item.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable | QtCore.Qt.ItemFlag.ItemIsEditable)
-        details_item.setToolTip("Double-click to select/copy this text: " + details)
-        self.setItem(row, 2, details_item)
-        
-        # Column 3: Action button (if node_name provided)
-        if node_name:
-            action_widget = self._create_action_button(node_name)
-            self.setCellWidget(row, 3, action_widget)
-        else:
-            # Empty cell for non-node validations
-            empty_item = QtWidgets.QTableWidgetItem("")
-            empty_item.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled)
-            self.setItem(row, 3, empty_item)
-        
-        # Set row border color based on status
-        self._set_row_border_color(row, status)
         
-        # Auto-resize row height to fit content
-        self.resizeRowToContents(row)
+        The row is queued and inserted, together with any other rows added in the
+        same call stack, once control returns to the event loop.
+        """
+        self._pending_results.append((status, rule_name, details, node_name))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QtCore.QTimer.singleShot(0, self._flush_pending_results)
     
-    def _create_status_widget(self, status):
-        """Create status icon widget"""
-        widget = QtWidgets.QWidget()
-        layout = QtWidgets.QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        
-        icon_label = QtWidgets.QLabel()
-        icon_label.setFixedSize(20, 20)
-        icon_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        
-        # Create status icon
-        self._set_status_icon(icon_label, status)
-        
-        layout.addWidget(icon_label)
-        widget.setStyleSheet("QWidget { background: transparent; }")
-        return widget
+    def _flush_pending_results(self):
+        """Insert the rows queued by add_validation_result with one model notification."""
+        self._flush_scheduled = False
+        if not self._pending_results:
+            return
+        results, self._pending_results = self._pending_results, []
+        self.begin_batch()
+        try:
+            self.results_model.add_results(results)
+        finally:
+            self.end_batch()
     
-    def _set_status_icon(self, label, status):
-        """Set status icon on label"""
-        # Try to load PNG icons first
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        icons_dir = os.path.join(script_dir, "icons")
-        
-        icon_files = {
-            'success': 'success.png',
-            'warning': 'warning.png', 
-            'error': 'error.png',
-            'running': 'info.png',
-            'pending': 'info.png'
-        }
-        
-        icon_file = icon_files.get(status, 'info.png')
-        icon_path = os.path.join(icons_dir, icon_file)
-        
-        if os.path.exists(icon_path):
-            pixmap = QtGui.QPixmap(icon_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(20, 20, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                label.setPixmap(scaled_pixmap)
-                return
-        
-        # Fallback to colored circles
-        colors = {
-            'success': QtGui.QColor(76, 175, 80),
-            'warning': QtGui.QColor(255, 152, 0),
-            'error': QtGui.QColor(244, 67, 54),
-            'running': QtGui.QColor(33, 150, 243),
-            'pending': QtGui.QColor(120, 120, 120)
-        }
-        
-        color = colors.get(status, colors['pending'])
-        pixmap = QtGui.QPixmap(20, 20)
-        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+    def add_validation_results_batch(self, results):
+        """
+        Add several validation result rows at once
         
-        painter = QtGui.QPainter(pixmap)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QtGui.QBrush(color))
-        painter.setPen(QtCore.Qt.PenStyle.NoPen)
-        painter.drawEllipse(2, 2, 16, 16)
-        painter.end()
+        The rows are inserted with one model notification instead of one per row.
         
-        label.setPixmap(pixmap)
+        Args:
+            results (list): (rule_name, status, details, node_name) tuples, in the
+                same order as the add_validation_result arguments
+        """
+        # Rows queued by add_validation_result go first so the order is kept
+        self._pending_results.extend(
+            (status, rule_name, details, node_name) for rule_name, status, details, node_name in results
+        )
+        self._flush_pending_results()
     
-    def _create_action_button(self, node_name):
-        """Create 'Go to Node' button with Nuke styling"""
-        widget = QtWidgets.QWidget()
-        layout = QtWidgets.QHBoxLayout(widget)
-        layout.setContentsMargins(4, 2, 4, 2)
-        layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        
-        button = QtWidgets.QPushButton("Go to Node")
-        button.setFixedSize(80, 20)
-        button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4a4a4a, stop:1 #3a3a3a);
-                color: #e0e0e0;
-                border: 1px solid #666666;
-                border-radius: 3px;
-                font-size: 9px;
-                font-weight: normal;
-                padding: 2px 4px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #5a5a5a, stop:1 #4a4a4a);
-                border: 1px solid #777777;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3a3a3a, stop:1 #2a2a2a);
-                border: 1px solid #555555;
-            }
-        """)
-        
-        # Connect button click to select node
-        button.clicked.connect(lambda: self._go_to_node(node_name))
-        button.setToolTip(f"Select and focus on {node_name}")
+    def begin_batch(self):
+        """
+        Suspend repaints and sorting while many results are added
         
-        layout.addWidget(button)
-        widget.setStyleSheet("QWidget { background: transparent; }")
-        return widget
+        Used around each flush of queued results; callers doing other bulk work on
+        the table can wrap it in begin_batch()/end_batch() the same way. Calls may
+        be nested.
+        """
+        if self._batch_depth == 0:
+            self._batch_sorting = self.isSortingEnabled()
+            self.setSortingEnabled(False)
+            self.setUpdatesEnabled(False)
+        self._batch_depth += 1
+    
+    def end_batch(self):
+        """Restore repaints and sorting suspended by the matching begin_batch()"""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.setUpdatesEnabled(True)
+            self.setSortingEnabled(self._batch_sorting)
     
     def _go_to_node(self, node_name):
         """Navigate to the specified node in Nuke"""
+        if nuke is None:
+            print(f"Cannot navigate to node {node_name}: Nuke is not available")
+            return
         try:
-            import nuke
             node = nuke.toNode(node_name)
             if node:
-                # Select the node
-                nuke.selectAll()
-                nuke.invertSelection()
-                node.setSelected(True)
-                
-                # Center the node in the Node Graph
-                nuke.zoom(1, [node.xpos(), node.ypos()])
-                
-                # Open the node's properties panel
-                nuke.show(node)
+                # Navigation shouldn't leave entries on the script's undo stack
+                nuke.Undo.disable()
+                try:
+                    # Deselect only what is selected rather than touching every node
+                    for selected in nuke.selectedNodes():
+                        selected.setSelected(False)
+                    node.setSelected(True)
+                    
+                    # Center the node in the Node Graph
+                    nuke.zoom(1, [node.xpos(), node.ypos()])
+                    
+                    # Open the node's properties panel
+                    nuke.show(node)
+                finally:
+                    nuke.Undo.enable()
                 
                 print(f"Navigated to node: {node_name}")
             else:
@@ -2517,66 +2949,590 @@ class ValidationResultsTable(QtWidgets.QTableWidget):
         except Exception as e:
             print(f"Error navigating to node {node_name}: {e}")
     
-    def _set_row_border_color(self, row, status):
-        """Set colored border for the entire row based on status"""
-        border_colors = {
-            'success': '#4caf50',
-            'warning': '#ff9800', 
-            'error': '#f44336',
-            'running': '#2196f3',
-            'pending': '#757575'
-        }
-        
-        border_color = border_colors.get(status, border_colors['pending'])
-        
-        # Apply border styling to each cell in the row
-        for col in range(self.columnCount()):
-            item = self.item(row, col)
-            if item:
-                item.setData(QtCore.Qt.ItemDataRole.BackgroundRole, QtGui.QColor(border_color + "20"))  # Very transparent background
-    
     def clear_results(self):
-        """Clear all validation results"""
-        self.setRowCount(0)
+        """Clear all validation results, including rows not inserted yet"""
+        self._pending_results = []
+        self.results_model.clear()
     
     def get_selected_rule(self):
         """Get the rule name of the currently selected row"""
-        current_row = self.currentRow()
+        current_row = self.currentIndex().row()
         if current_row >= 0:
-            rule_item = self.item(current_row, 1)
-            if rule_item:
-                return rule_item.text()
+            return self.results_model.rule_at(current_row)
+        return None
+    
+    def get_selected_details(self):
+        """Get the full details text of the currently selected row"""
+        current_row = self.currentIndex().row()
+        if current_row >= 0:
+            return self.results_model.details_at(current_row)
         return None
 
-
-class RuleItemWidget(QtWidgets.QWidget):
+class _TokenTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model over the token configs of TableBasedFilenameTemplateBuilder.
+    
+    Each row is one token config dict (name, token_def, value, separator and, for
+    range spinners, min_value/max_value). Cells are painted from these dicts; the
+    value and separator editors are only created by _TokenControlDelegate while a
+    cell is being edited, and the order/remove buttons are painted by delegates.
+    
+    Columns:
+        0 - Token label
+        1 - Value/Control
+        2 - Separator
+        3 - Order (up/down buttons)
+        4 - Remove button
+    """
+    HEADERS = ["Token", "Value/Control", "Separator", "Order", "Remove"]
+    # Drag payload for reordering rows: the source row number as text
+    ROW_MIME_TYPE = "application/x-nuke-validator-token-row"
+    
+    _STATIC_TEXT_COLOR = QtGui.QColor("#888888")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.token_configs = []
+    
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.token_configs)
+    
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            # Dropping below the last row moves the token to the end
+            return Qt.ItemFlag.ItemIsDropEnabled
+        flags = (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                 | Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled)
+        column = index.column()
+        if column == 2 or (column == 1 and self.token_configs[index.row()]["token_def"]["control"] != "static"):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        config = self.token_configs[index.row()]
+        token_def = config["token_def"]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return token_def["label"]
+            if column == 1:
+                return self._value_text(config)
+            if column == 2:
+                return config["separator"] if config["separator"] else "(none)"
+            return None
+        if role == Qt.ItemDataRole.EditRole:
+            if column == 1:
+                return config["value"]
+            if column == 2:
+                return config["separator"]
+            return None
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if column == 0:
+                return token_def.get("desc")
+            if column == 3:
+                return "Move token up/down"
+            if column == 4:
+                return "Remove token"
+            return None
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column == 1 and token_def["control"] == "static":
+                return self._STATIC_TEXT_COLOR
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column == 2:
+                return int(Qt.AlignmentFlag.AlignCenter)
+            return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        config = self.token_configs[index.row()]
+        column = index.column()
+        
+        if column == 1:
+            if config["token_def"]["control"] == "range_spinner":
+                min_value, max_value = value
+                if config.get("min_value") == min_value and config.get("max_value") == max_value:
+                    return True
+                config["min_value"] = min_value
+                config["max_value"] = max_value
+            else:
+                if config["value"] == value:
+                    return True
+                config["value"] = value
+        elif column == 2:
+            if value == "(none)":
+                value = ""
+            if config["separator"] == value:
+                return True
+            config["separator"] = value
+        else:
+            return False
+        
+        self.dataChanged.emit(index, index)
+        return True
+    
+    @staticmethod
+    def _value_text(config):
+        """Text shown in the Value/Control cell when no editor is open."""
+        token_def = config["token_def"]
+        control = token_def["control"]
+        value = config["value"]
+        if control == "range_spinner":
+            min_value = config.get("min_value", token_def.get("default_min", token_def["min"]))
+            max_value = config.get("max_value", token_def.get("default_max", token_def["max"]))
+            return f"Min: {min_value}  Max: {max_value}"
+        if control == "spinner":
+            return str(token_def["default"] if value is None else value)
+        if control == "dropdown":
+            if value is None:
+                return token_def["options"][0] if token_def["options"] else ""
+            return str(value)
+        if control == "multiselect":
+            return ", ".join(value) if value else "None selected"
+        if control == "static":
+            return "(automatic)"
+        return "" if value is None else str(value)
+    
+    def config_at(self, row):
+        """Return the token config dict shown in row."""
+        return self.token_configs[row]
+    
+    def append_config(self, config):
+        """Append a token config as a new row."""
+        row = len(self.token_configs)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.token_configs.append(config)
+        self.endInsertRows()
+    
+    def remove_config(self, row):
+        """Remove the token config at row."""
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self.token_configs[row]
+        self.endRemoveRows()
+    
+    def move_config(self, row, target):
+        """Move the token config at row so that it ends up at row target."""
+        # beginMoveRows takes the row the moved item will end up in front of
+        destination = target if target < row else target + 1
+        self.beginMoveRows(QtCore.QModelIndex(), row, row, QtCore.QModelIndex(), destination)
+        self.token_configs.insert(target, self.token_configs.pop(row))
+        self.endMoveRows()
+    
+    # Drag-and-drop reordering: the view drags a row number and the drop becomes a
+    # move_config(), so rows keep their dicts and no editor state is lost
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+    
+    def mimeTypes(self):
+        return [self.ROW_MIME_TYPE]
+    
+    def mimeData(self, indexes):
+        if not indexes:
+            return None
+        mime_data = QtCore.QMimeData()
+        mime_data.setData(self.ROW_MIME_TYPE, QtCore.QByteArray(str(indexes[0].row()).encode()))
+        return mime_data
+    
+    def dropMimeData(self, data, action, row, column, parent):
+        if action != Qt.DropAction.MoveAction or not data.hasFormat(self.ROW_MIME_TYPE):
+            return False
+        source = int(bytes(data.data(self.ROW_MIME_TYPE)).decode())
+        if not 0 <= source < len(self.token_configs):
+            return False
+        if parent.isValid():
+            # Dropped onto a row: take that row's place
+            target = parent.row()
+        else:
+            # Dropped into the gap before row (-1 below the last row); the gap index
+            # counts the source row, which is gone once it is moved
+            if row < 0:
+                row = len(self.token_configs)
+            target = row if row < source else row - 1
+        if target != source:
+            self.move_config(source, target)
+        return True
+    
+    def reset_configs(self, token_configs=None):
+        """Replace the configs (or, with None, re-read ones edited in place) with one model reset."""
+        self.beginResetModel()
+        if token_configs is not None:
+            self.token_configs = token_configs
+        self.endResetModel()
+
+class _TokenControlDelegate(QtWidgets.QStyledItemDelegate):
     """
-    DEPRECATED: Legacy widget - use ValidationResultsTable instead
-    Kept for backward compatibility during transition
+    Creates the Value/Control and Separator editors of the template builder on demand.
+    
+    A cell only gets a spin box, combo box or multiselect while it is being edited.
+    Editors commit on every change so the regex preview updates live, but nothing is
+    written back for an editor the user opened and left untouched; a token keeps
+    value None (the generic pattern) until it is actually edited.
     """
-    def __init__(self, rule_name, parent=None):
-        super(RuleItemWidget, self).__init__(parent)
-        self.rule_name = rule_name
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Closed separator combos; every row offers the same options, so they are reused
+        self._separator_pool = []
+    
+    def createEditor(self, parent, option, index):
+        if index.column() == 2:
+            if self._separator_pool:
+                editor = self._separator_pool.pop()
+                editor.setParent(parent)
+            else:
+                editor = QtWidgets.QComboBox(parent)
+                editor.setModel(_separator_list_model())
+                editor.setFixedWidth(70)
+                editor.setObjectName("tokenSeparator")
+                editor.currentTextChanged.connect(lambda _text: self._commit(editor))
+            editor._edited = False
+            return editor
+        if index.column() != 1:
+            return None
         
-        # Simple layout for legacy support
-        layout = QtWidgets.QHBoxLayout(self)
-        layout.setContentsMargins(4, 2, 4, 2)
+        token_def = index.model().config_at(index.row())["token_def"]
+        control = token_def["control"]
+        
+        if control == "range_spinner":
+            # Range spinner with min/max controls
+            editor = QtWidgets.QWidget(parent)
+            hlayout = QtWidgets.QHBoxLayout(editor)
+            hlayout.setContentsMargins(0, 0, 0, 0)
+            hlayout.setSpacing(4)
+            
+            editor.min_spinner = QtWidgets.QSpinBox()
+            editor.min_spinner.setMinimum(token_def["min"])
+            editor.min_spinner.setMaximum(token_def["max"])
+            editor.min_spinner.setFixedWidth(40)
+            
+            editor.max_spinner = QtWidgets.QSpinBox()
+            editor.max_spinner.setMinimum(token_def["min"])
+            editor.max_spinner.setMaximum(token_def["max"])
+            editor.max_spinner.setFixedWidth(40)
+            
+            hlayout.addWidget(QtWidgets.QLabel("Min:"))
+            hlayout.addWidget(editor.min_spinner)
+            hlayout.addWidget(QtWidgets.QLabel("Max:"))
+            hlayout.addWidget(editor.max_spinner)
+            hlayout.addStretch()
+            
+            # Keep min ≤ max, then commit the pair
+            def update_min(value):
+                if value > editor.max_spinner.value():
+                    editor.max_spinner.setValue(value)
+                self._commit(editor)
+                
+            def update_max(value):
+                if value < editor.min_spinner.value():
+                    editor.min_spinner.setValue(value)
+                self._commit(editor)
+                
+            editor.min_spinner.valueChanged.connect(update_min)
+            editor.max_spinner.valueChanged.connect(update_max)
+            
+        elif control == "spinner":
+            editor = QtWidgets.QSpinBox(parent)
+            editor.setMinimum(token_def["min"])
+            editor.setMaximum(token_def["max"])
+            editor.setValue(token_def["default"])
+            editor.setFixedWidth(80)
+            editor.valueChanged.connect(lambda _value: self._commit(editor))
+            
+        elif control == "dropdown":
+            editor = QtWidgets.QComboBox(parent)
+            editor.addItems(token_def["options"])
+            # Wide enough to prevent text cutoff
+            editor.setMinimumWidth(180)
+            editor.setSizeAdjustPolicy(QtWidgets.QComboBox.SizeAdjustPolicy.AdjustToContents)
+            editor.setMaxVisibleItems(10)
+            editor.currentTextChanged.connect(lambda _text: self._commit(editor))
+            
+        elif control == "multiselect":
+            editor = SimpleMultiSelectWidget(token_def["options"], parent)
+            editor.setMinimumWidth(180)
+            editor.selectionChanged.connect(lambda: self._commit(editor))
+            
+        else:
+            return None
         
-        # Just show the rule name
-        self.name_label = QtWidgets.QLabel(rule_name)
-        self.name_label.setStyleSheet("QLabel { color: #e0e0e0; }")
-        layout.addWidget(self.name_label)
+        editor.setObjectName("tokenControl")
+        editor._edited = False
+        return editor
+    
+    def destroyEditor(self, editor, index):
+        # The view has already hidden the editor and removed its event filter
+        if editor.objectName() == "tokenSeparator":
+            self._separator_pool.append(editor)
+        else:
+            super().destroyEditor(editor, index)
+    
+    def _commit(self, editor):
+        """Mark the editor as changed by the user and push its value to the model."""
+        editor._edited = True
+        self.commitData.emit(editor)
+    
+    @staticmethod
+    def _set_blocked(widget, setter, value):
+        """Call setter(value) without letting widget emit change signals."""
+        widget.blockSignals(True)
+        setter(value)
+        widget.blockSignals(False)
+    
+    def setEditorData(self, editor, index):
+        config = index.model().config_at(index.row())
+        
+        # Only touch widgets whose value differs, so an update echoed back from the
+        # model doesn't reset a spin box the user is typing in
+        if index.column() == 2:
+            combo_index = editor.findText(config["separator"] if config["separator"] else "(none)")
+            if combo_index < 0:
+                # If the exact separator isn't found, default to "_"
+                combo_index = editor.findText("_")
+            if combo_index != editor.currentIndex():
+                self._set_blocked(editor, editor.setCurrentIndex, combo_index)
+            return
         
-        # Status label
-        self.status_label = QtWidgets.QLabel("Legacy widget - use ValidationResultsTable")
-        self.status_label.setStyleSheet("QLabel { color: #ff9800; font-style: italic; }")
-        layout.addWidget(self.status_label)
+        token_def = config["token_def"]
+        value = config["value"]
+        if isinstance(editor, SimpleMultiSelectWidget):
+            if isinstance(value, list) and value != editor.get_selected_values():
+                editor.set_selected_values(value)
+        elif isinstance(editor, QtWidgets.QSpinBox):
+            if value is not None:
+                try:
+                    value = int(value)
+                except (ValueError, TypeError):
+                    return
+                if value != editor.value():
+                    self._set_blocked(editor, editor.setValue, value)
+        elif isinstance(editor, QtWidgets.QComboBox):
+            if value is not None:
+                combo_index = editor.findText(str(value))
+                if combo_index >= 0 and combo_index != editor.currentIndex():
+                    self._set_blocked(editor, editor.setCurrentIndex, combo_index)
+        else:
+            min_value = config.get("min_value", token_def.get("default_min", token_def["min"]))
+            max_value = config.get("max_value", token_def.get("default_max", token_def["max"]))
+            for spinner, spinner_value in ((editor.min_spinner, min_value), (editor.max_spinner, max_value)):
+                if spinner_value != spinner.value():
+                    self._set_blocked(spinner, spinner.setValue, spinner_value)
     
-    def set_status(self, status):
-        """Legacy method"""
-        pass
+    def setModelData(self, editor, model, index):
+        if not editor._edited:
+            return
+        if index.column() == 2:
+            model.setData(index, editor.currentText())
+        elif isinstance(editor, SimpleMultiSelectWidget):
+            model.setData(index, editor.get_selected_values())
+        elif isinstance(editor, QtWidgets.QSpinBox):
+            model.setData(index, editor.value())
+        elif isinstance(editor, QtWidgets.QComboBox):
+            model.setData(index, editor.currentText())
+        else:
+            model.setData(index, (editor.min_spinner.value(), editor.max_spinner.value()))
+    
+    def updateEditorGeometry(self, editor, option, index):
+        # Same margins the old cell widgets used; fixed-width editors keep their width,
+        # left-aligned in the value column and centered in the separator column
+        rect = option.rect.adjusted(4, 2, -4, -2)
+        width = min(rect.width(), editor.maximumWidth())
+        if index.column() == 2:
+            rect.moveLeft(rect.left() + (rect.width() - width) // 2)
+        rect.setWidth(width)
+        editor.setGeometry(rect)
+
+class _OrderButtonsDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints the ▲/▼ buttons of the template builder's Order column and handles their
+    clicks, replacing two QPushButtons and a wrapper widget per row.
+    """
+    BUTTON_SIZE = QtCore.QSize(20, 12)
+    
+    _FILL_COLOR = QtGui.QColor("#4a4a4a")
+    _DISABLED_FILL_COLOR = QtGui.QColor("#2a2a2a")
+    _BORDER_COLOR = QtGui.QColor("#666666")  # also the disabled glyph color
+    _TEXT_COLOR = QtGui.QColor("#e0e0e0")
+    
+    def __init__(self, on_up, on_down, parent=None):
+        super().__init__(parent)
+        self._on_up = on_up
+        self._on_down = on_down
+    
+    def _button_rects(self, cell_rect):
+        """Return the (up, down) button rects, stacked 1px apart in the cell center."""
+        center = cell_rect.center()
+        up_rect = QtCore.QRect(QtCore.QPoint(center.x() - 10, center.y() - 12), self.BUTTON_SIZE)
+        down_rect = QtCore.QRect(QtCore.QPoint(center.x() - 10, center.y() + 1), self.BUTTON_SIZE)
+        return up_rect, down_rect
+    
+    def paint(self, painter, option, index):
+        # Background and selection from the base delegate; the buttons are drawn on top
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+        
+        row = index.row()
+        up_rect, down_rect = self._button_rects(option.rect)
+        
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        font = QtGui.QFont(option.font)
+        font.setPixelSize(8)
+        painter.setFont(font)
+        for rect, glyph, enabled in ((up_rect, "▲", row > 0),
+                                     (down_rect, "▼", row < index.model().rowCount() - 1)):
+            painter.setBrush(self._FILL_COLOR if enabled else self._DISABLED_FILL_COLOR)
+            painter.setPen(self._BORDER_COLOR)
+            painter.drawRoundedRect(QtCore.QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 2, 2)
+            painter.setPen(self._TEXT_COLOR if enabled else self._BORDER_COLOR)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, glyph)
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QtCore.QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            row = index.row()
+            pos = event.position().toPoint()
+            up_rect, down_rect = self._button_rects(option.rect)
+            if up_rect.contains(pos):
+                if row > 0:
+                    self._on_up(row)
+                return True
+            if down_rect.contains(pos):
+                if row < model.rowCount() - 1:
+                    self._on_down(row)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+class _RemoveButtonDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints the round × button of the template builder's Remove column and handles its
+    clicks, replacing a QPushButton and a wrapper widget per row.
+    """
+    BUTTON_SIZE = QtCore.QSize(20, 20)
+    
+    _FILL_COLOR = QtGui.QColor("#d32f2f")
+    _HOVER_FILL_COLOR = QtGui.QColor("#f44336")
+    _TEXT_COLOR = QtGui.QColor("white")
+    
+    def __init__(self, on_clicked, parent=None):
+        super().__init__(parent)
+        self._on_clicked = on_clicked
+    
+    def _button_rect(self, cell_rect):
+        rect = QtCore.QRect(QtCore.QPoint(0, 0), self.BUTTON_SIZE)
+        rect.moveCenter(cell_rect.center())
+        return rect
+    
+    def paint(self, painter, option, index):
+        # Background and selection from the base delegate; the button is drawn on top
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+        
+        rect = self._button_rect(option.rect)
+        hovered = bool(option.state & QtWidgets.QStyle.StateFlag.State_MouseOver)
+        
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setBrush(self._HOVER_FILL_COLOR if hovered else self._FILL_COLOR)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(rect)
+        
+        font = QtGui.QFont(option.font)
+        font.setPixelSize(12)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(self._TEXT_COLOR)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "×")
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QtCore.QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            if self._button_rect(option.rect).contains(event.position().toPoint()):
+                self._on_clicked(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+class _TemplateBuilderBase(QtWidgets.QWidget):
+    """
+    Change notification shared by the filename template builders.
+    
+    Subclasses call _notify_change() after any edit to their tokens; the owner
+    connects templateChanged to its update_regex().
+    """
+    # Emitted (at most once per event-loop pass) after the tokens or their settings change
+    templateChanged = QtCore.Signal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Set while a caller is adding tokens in bulk; skips per-change regex updates
+        self._notify_suppressed = False
+        # Set while a deferred regex update is queued; further changes fold into it
+        self._update_pending = False
+    
+    @contextlib.contextmanager
+    def suppress_notifications(self):
+        """Context manager that holds back templateChanged while a caller edits tokens in bulk.
+        
+        Notifications resume on exit even if the body raises; the caller refreshes the
+        regex itself afterwards.
+        """
+        self._notify_suppressed = True
+        try:
+            yield
+        finally:
+            self._notify_suppressed = False
+    
+    def _notify_change(self):
+        """Queue a templateChanged emission.
+        
+        The signal fires once control returns to the event loop, so several
+        edits in one call stack rebuild the regex once.
+        """
+        if self._notify_suppressed or self._update_pending:
+            return
+        self._update_pending = True
+        QtCore.QTimer.singleShot(0, self._do_notify)
+        
+    def _do_notify(self):
+        """Emit the templateChanged queued by _notify_change."""
+        self._update_pending = False
+        self.templateChanged.emit()
+
+class _TokenWidgetTemplateBuilder(_TemplateBuilderBase):
+    """
+    Base for the builders that show each token as its own widget with ×/up/down buttons.
+    
+    Subclasses connect those buttons to the slots below and implement remove_token,
+    move_token_up and move_token_down for a token widget.
+    """
+    # The clicked button's parent is its token widget, so no per-widget closure is needed
+    def _on_remove_clicked(self):
+        self.remove_token(self.sender().parent())
+    
+    def _on_up_clicked(self):
+        self.move_token_up(self.sender().parent())
+    
+    def _on_down_clicked(self):
+        self.move_token_down(self.sender().parent())
 
-class TableBasedFilenameTemplateBuilder(QtWidgets.QWidget):
+class TableBasedFilenameTemplateBuilder(_TemplateBuilderBase):
     """
     Advanced table-based UI for building filename templates with rich token configuration.
     
@@ -2609,18 +3565,33 @@ class TableBasedFilenameTemplateBuilder(QtWidgets.QWidget):
         header_label.setStyleSheet("QLabel { color: #e0e0e0; font-weight: bold; font-size: 11px; }")
         main_layout.addWidget(header_label)
         
-        # Create table
-        self.table = QtWidgets.QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Token", "Value/Control", "Separator", "Order", "Remove"])
+        # Create table; rows are painted from token_model, editors are made on demand
+        self.token_model = _TokenTableModel(self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.token_model)
+        control_delegate = _TokenControlDelegate(self.table)
+        self.table.setItemDelegateForColumn(1, control_delegate)
+        self.table.setItemDelegateForColumn(2, control_delegate)
+        self.table.setItemDelegateForColumn(3, _OrderButtonsDelegate(self._move_token_up, self._move_token_down, self.table))
+        self.table.setItemDelegateForColumn(4, _RemoveButtonDelegate(self._remove_token, self.table))
+        # Needed for the remove button's hover state
+        self.table.setMouseTracking(True)
         
         # Configure table behavior
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(
+            QtWidgets.QAbstractItemView.EditTrigger.CurrentChanged
+            | QtWidgets.QAbstractItemView.EditTrigger.SelectedClicked
+            | QtWidgets.QAbstractItemView.EditTrigger.DoubleClicked
+        )
         self.table.setAlternatingRowColors(True)
         self.table.setSortingEnabled(False)
+        # Rows can be dragged to reorder them; the model turns the drop into a row move.
+        # Overwrite mode stays off so the view never clears the dragged row's cells afterwards.
         self.table.setDragDropMode(QtWidgets.QAbstractItemView.DragDropMode.InternalMove)
         self.table.setDefaultDropAction(QtCore.Qt.DropAction.MoveAction)
+        self.table.setDragDropOverwriteMode(False)
         
         # Configure headers
         header = self.table.horizontalHeader()
@@ -2650,7 +3621,7 @@ class TableBasedFilenameTemplateBuilder(QtWidgets.QWidget):
         
         # Apply dark theme styling
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #393939;
                 alternate-background-color: #333333;
                 color: #e0e0e0;
@@ -2660,13 +3631,13 @@ class TableBasedFilenameTemplateBuilder(QtWidgets.QWidget):
                 font-size: 11px;
             }
             
-            QTableWidget::item {
+            QTableView::item {
                 border: none;
                 padding: 4px 6px;
                 background: transparent;
             }
             
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #4a4a4a;
                 color: #ffffff;
             }
@@ -2691,8 +3662,10 @@ class TableBasedFilenameTemplateBuilder(QtWidgets.QWidget):
         
         main_layout.addWidget(self.table)
         
-        # Track token configurations for easy access
-        self.token_configs = []
+        # Value/separator edits reach the model through the delegate or _update_token_*
+        self.token_model.dataChanged.connect(lambda *args: self._notify_change())
+        # Drag-and-drop reorders arrive as row moves in the model
+        self.token_model.rowsMoved.connect(lambda *args: self._notify_change())
         
         self.setStyleSheet("""
             TableBasedFilenameTemplateBuilder {
@@ -2702,417 +3675,63 @@ class TableBasedFilenameTemplateBuilder(QtWidgets.QWidget):
             }
         """)
         
+    @property
+    def token_configs(self):
+        """Token configuration dicts in template order (the model's row list)."""
+        return self.token_model.token_configs
+        
     def add_token(self, token_def):
         """Add a token as a new row in the table"""
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        
-        # Store token definition
-        token_config = {
+        self.token_model.append_config({
             "name": token_def["name"],
             "token_def": token_def,
             "value": None,
             "separator": "_"
-        }
-        self.token_configs.append(token_config)
-        
-        # Column 0: Token name (read-only)
-        token_item = QtWidgets.QTableWidgetItem(token_def["label"])
-        token_item.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable)
-        token_item.setToolTip(token_def["desc"])
-        self.table.setItem(row, 0, token_item)
-        
-        # Column 1: Control widget (editable)
-        control_widget = self._create_control_widget(token_def, row)
-        self.table.setCellWidget(row, 1, control_widget)
-        
-        # Column 2: Separator dropdown
-        separator_widget = self._create_separator_widget(row)
-        self.table.setCellWidget(row, 2, separator_widget)
-        
-        # Column 3: Order buttons (up/down)
-        order_widget = self._create_order_widget(row)
-        self.table.setCellWidget(row, 3, order_widget)
-        
-        # Column 4: Remove button
-        remove_widget = self._create_remove_widget(row)
-        self.table.setCellWidget(row, 4, remove_widget)
-        
-        self._update_order_buttons()
+        })
         self._notify_change()
-        
-    def _create_control_widget(self, token_def, row):
-        """Create the appropriate control widget for the token"""
-        widget = QtWidgets.QWidget()
-        layout = QtWidgets.QHBoxLayout(widget)
-        layout.setContentsMargins(4, 2, 4, 2)
-        layout.setSpacing(4)
-        
-        control = None
-        
-        if token_def["control"] == "range_spinner":
-            # Range spinner with min/max controls
-            container = QtWidgets.QWidget()
-            hlayout = QtWidgets.QHBoxLayout(container)
-            hlayout.setContentsMargins(0, 0, 0, 0)
-            hlayout.setSpacing(4)
-            
-            min_spinner = QtWidgets.QSpinBox()
-            min_spinner.setMinimum(token_def["min"])
-            min_spinner.setMaximum(token_def["max"])
-            min_spinner.setValue(token_def.get("default_min", token_def["min"]))
-            min_spinner.setFixedWidth(40)
-            
-            max_spinner = QtWidgets.QSpinBox()
-            max_spinner.setMinimum(token_def["min"])
-            max_spinner.setMaximum(token_def["max"])
-            max_spinner.setValue(token_def.get("default_max", token_def["max"]))
-            max_spinner.setFixedWidth(40)
-            
-            hlayout.addWidget(QtWidgets.QLabel("Min:"))
-            hlayout.addWidget(min_spinner)
-            hlayout.addWidget(QtWidgets.QLabel("Max:"))
-            hlayout.addWidget(max_spinner)
-            
-            # Connect signals to update values and ensure min ≤ max
-            def update_min(value):
-                if value > max_spinner.value():
-                    max_spinner.setValue(value)
-                self._update_range_token_value(row, value, max_spinner.value())
-                
-            def update_max(value):
-                if value < min_spinner.value():
-                    min_spinner.setValue(value)
-                self._update_range_token_value(row, min_spinner.value(), value)
-                
-            min_spinner.valueChanged.connect(update_min)
-            max_spinner.valueChanged.connect(update_max)
-            
-            control = container
-            
-        elif token_def["control"] == "spinner":
-            control = QtWidgets.QSpinBox()
-            control.setMinimum(token_def["min"])
-            control.setMaximum(token_def["max"])
-            control.setValue(token_def["default"])
-            control.setFixedWidth(80)
-            control.valueChanged.connect(lambda v: self._update_token_value(row, v))
-            
-        elif token_def["control"] == "dropdown":
-            control = QtWidgets.QComboBox()
-            control.addItems(token_def["options"])
-            # Increased width to prevent text cutoff
-            control.setMinimumWidth(180)
-            # Use size hint to ensure text fits
-            control.setSizeAdjustPolicy(QtWidgets.QComboBox.SizeAdjustPolicy.AdjustToContents)
-            control.setMaxVisibleItems(10)
-            control.currentTextChanged.connect(lambda t: self._update_token_value(row, t))
-            
-        elif token_def["control"] == "multiselect":
-            control = SimpleMultiSelectWidget(token_def["options"])
-            # Increased width to prevent text cutoff
-            control.setMinimumWidth(180)
-            control.selectionChanged.connect(lambda: self._update_token_value(row, control.get_selected_values()))
-            
-        elif token_def["control"] == "static":
-            control = QtWidgets.QLabel("(automatic)")
-            control.setStyleSheet("QLabel { color: #888; font-style: italic; }")
-        
-        if control:
-            control.setStyleSheet("""
-                QWidget {
-                    background: #3a3a3a;
-                    color: #e0e0e0;
-                    border: 1px solid #555;
-                    border-radius: 3px;
-                    font-size: 10px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    width: 20px; /* Wider dropdown button */
-                }
-                QComboBox::down-arrow {
-                    border-left: 4px solid transparent;
-                    border-right: 4px solid transparent;
-                    border-top: 4px solid #e0e0e0;
-                }
-                QComboBox {
-                    padding-left: 6px;
-                    padding-right: 20px; /* More padding for text */
-                    text-align: left;
-                }
-                QComboBox QAbstractItemView {
-                    background: #3a3a3a;
-                    color: #e0e0e0;
-                    selection-background-color: #4a9eff;
-                    padding: 4px;
-                }
-                QComboBox:!editable {
-                    background: #3a3a3a;
-                }
-            """)
-            layout.addWidget(control)
-        
-        layout.addStretch()
-        widget.setStyleSheet("QWidget { background: transparent; }")
-        return widget
-    
-    def _create_separator_widget(self, row):
-        """Create separator dropdown widget"""
-        widget = QtWidgets.QWidget()
-        layout = QtWidgets.QHBoxLayout(widget)
-        layout.setContentsMargins(4, 2, 4, 2)
-        layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        
-        separator_combo = QtWidgets.QComboBox()
-        separator_combo.addItems(["_", ".", "-", " ", "(none)"])
-        separator_combo.setCurrentText("_")
-        separator_combo.setFixedWidth(70)
-        separator_combo.setStyleSheet("""
-            QComboBox {
-                background: #3a3a3a;
-                color: #e0e0e0;
-                border: 1px solid #555;
-                border-radius: 3px;
-                font-size: 10px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 16px;
-            }
-            QComboBox::down-arrow {
-                border-left: 3px solid transparent;
-                border-right: 3px solid transparent;
-                border-top: 3px solid #e0e0e0;
-            }
-            QComboBox QAbstractItemView {
-                background: #3a3a3a;
-                color: #e0e0e0;
-                selection-background-color: #4a9eff;
-            }
-        """)
-        
-        separator_combo.currentTextChanged.connect(lambda t: self._update_token_separator(row, t))
-        layout.addWidget(separator_combo)
-        
-        widget.setStyleSheet("QWidget { background: transparent; }")
-        return widget
-    
-    def _create_order_widget(self, row):
-        """Create up/down movement buttons"""
-        widget = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
-        layout.setSpacing(1)
-        layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        
-        up_btn = QtWidgets.QPushButton("▲")
-        up_btn.setFixedSize(20, 12)
-        up_btn.clicked.connect(lambda: self._move_token_up(row))
-        
-        down_btn = QtWidgets.QPushButton("▼")
-        down_btn.setFixedSize(20, 12)
-        down_btn.clicked.connect(lambda: self._move_token_down(row))
-        
-        for btn in [up_btn, down_btn]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: #4a4a4a;
-                    color: #e0e0e0;
-                    border: 1px solid #666;
-                    border-radius: 2px;
-                    font-size: 8px;
-                    padding: 0px;
-                }
-                QPushButton:hover { background: #5a5a5a; }
-                QPushButton:pressed { background: #2a2a2a; }
-                QPushButton:disabled { background: #2a2a2a; color: #666; }
-            """)
-        
-        layout.addWidget(up_btn)
-        layout.addWidget(down_btn)
-        
-        widget.setStyleSheet("QWidget { background: transparent; }")
-        return widget
-    
-    def _create_remove_widget(self, row):
-        """Create remove button"""
-        widget = QtWidgets.QWidget()
-        layout = QtWidgets.QHBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
-        layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        
-        remove_btn = QtWidgets.QPushButton("×")
-        remove_btn.setFixedSize(20, 20)
-        remove_btn.clicked.connect(lambda: self._remove_token(row))
-        remove_btn.setStyleSheet("""
-            QPushButton {
-                background: #d32f2f;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background: #f44336; }
-            QPushButton:pressed { background: #b71c1c; }
-        """)
-        
-        layout.addWidget(remove_btn)
-        widget.setStyleSheet("QWidget { background: transparent; }")
-        return widget
     
     def _update_token_value(self, row, value):
         """Update the token value in the config"""
         if 0 <= row < len(self.token_configs):
-            self.token_configs[row]["value"] = value
-            self._notify_change()
+            self.token_model.setData(self.token_model.index(row, 1), value)
             
     def _update_range_token_value(self, row, min_value, max_value):
         """Update min and max values for range spinner tokens"""
         if 0 <= row < len(self.token_configs):
-            self.token_configs[row]["min_value"] = min_value
-            self.token_configs[row]["max_value"] = max_value
-            self._notify_change()
+            self.token_model.setData(self.token_model.index(row, 1), (min_value, max_value))
     
     def _update_token_separator(self, row, separator):
         """Update the separator for a token at the given row"""
         if 0 <= row < len(self.token_configs):
-            if separator == "(none)":
-                separator = ""
-            self.token_configs[row]["separator"] = separator
-            self._notify_change()
+            self.token_model.setData(self.token_model.index(row, 2), separator)
     
     def _move_token_up(self, row):
         """Move token up in the order"""
         if row > 0 and row < len(self.token_configs):
-            # Swap configurations
-            self.token_configs[row], self.token_configs[row-1] = self.token_configs[row-1], self.token_configs[row]
-            self._rebuild_table()
+            self.token_model.move_config(row, row - 1)
+            self._notify_change()
     
     def _move_token_down(self, row):
         """Move token down in the order"""
         if row >= 0 and row < len(self.token_configs) - 1:
-            # Swap configurations
-            self.token_configs[row], self.token_configs[row+1] = self.token_configs[row+1], self.token_configs[row]
-            self._rebuild_table()
+            self.token_model.move_config(row, row + 1)
+            self._notify_change()
     
     def _remove_token(self, row):
         """Remove token at the given row"""
         if 0 <= row < len(self.token_configs):
-            self.token_configs.pop(row)
-            self._rebuild_table()
+            self.token_model.remove_config(row)
+            self._notify_change()
     
     def _rebuild_table(self):
-        """Rebuild the entire table from token_configs"""
-        self.table.setRowCount(0)
-        
-        for i, config in enumerate(self.token_configs):
-            self.table.insertRow(i)
-            token_def = config["token_def"]
-            
-            # Column 0: Token name
-            token_item = QtWidgets.QTableWidgetItem(token_def["label"])
-            token_item.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable)
-            token_item.setToolTip(token_def["desc"])
-            self.table.setItem(i, 0, token_item)
-            
-            # Column 1: Control widget
-            control_widget = self._create_control_widget(token_def, i)
-            self.table.setCellWidget(i, 1, control_widget)
-            
-            # Set the control value from config
-            self._restore_control_value(i, config)
-            
-            # Column 2: Separator dropdown
-            separator_widget = self._create_separator_widget(i)
-            self.table.setCellWidget(i, 2, separator_widget)
-            
-            # Set separator value
-            separator_combo = separator_widget.findChild(QtWidgets.QComboBox)
-            if separator_combo:
-                sep_text = config["separator"] if config["separator"] else "(none)"
-                idx = separator_combo.findText(sep_text)
-                if idx >= 0:
-                    separator_combo.setCurrentIndex(idx)
-                else:
-                    # If the exact separator isn't found, default to "_"
-                    default_idx = separator_combo.findText("_")
-                    if default_idx >= 0:
-                        separator_combo.setCurrentIndex(default_idx)
-            
-            # Column 3: Order buttons
-            order_widget = self._create_order_widget(i)
-            self.table.setCellWidget(i, 3, order_widget)
-            
-            # Column 4: Remove button
-            remove_widget = self._create_remove_widget(i)
-            self.table.setCellWidget(i, 4, remove_widget)
-        
-        self._update_order_buttons()
+        """Refresh the table after token_configs were edited in place (e.g. while loading rules)"""
+        self.token_model.reset_configs()
         self._notify_change()
     
-    def _restore_control_value(self, row, config):
-        """Restore the control value from configuration"""
-        control_widget = self.table.cellWidget(row, 1)
-        if not control_widget:
-            return
-            
-        # Find the actual control within the widget
-        for child in control_widget.findChildren(QtWidgets.QWidget):
-            if isinstance(child, QtWidgets.QSpinBox) and config["value"] is not None:
-                try:
-                    child.setValue(int(config["value"]))
-                except (ValueError, TypeError):
-                    pass
-                break
-            elif isinstance(child, QtWidgets.QComboBox) and config["value"] is not None:
-                idx = child.findText(str(config["value"]))
-                if idx >= 0:
-                    child.setCurrentIndex(idx)
-                break
-            elif isinstance(child, SimpleMultiSelectWidget) and config["value"] is not None:
-                if isinstance(config["value"], list):
-                    child.set_selected_values(config["value"])
-                break
-    
-    def _update_order_buttons(self):
-        """Update enabled state of order buttons"""
-        for row in range(self.table.rowCount()):
-            order_widget = self.table.cellWidget(row, 3)
-            if order_widget:
-                buttons = order_widget.findChildren(QtWidgets.QPushButton)
-                if len(buttons) >= 2:
-                    up_btn, down_btn = buttons[0], buttons[1]
-                    up_btn.setEnabled(row > 0)
-                    down_btn.setEnabled(row < self.table.rowCount() - 1)
-    
-    def _notify_change(self):
-        """Notify parent of changes"""
-        parent = self.parent()
-        while parent:
-            if hasattr(parent, 'update_regex'):
-                parent.update_regex()
-                break
-            parent = parent.parent()
-    
-        # Removed duplicate method
-        result = []
-        for config in self.token_configs:
-            result.append({
-                "name": config["name"],
-                "value": config["value"],
-                "separator": config["separator"]
-            })
-        return result
-    
     def clear(self):
         """Clear all tokens"""
-        self.table.setRowCount(0)
-        self.token_configs = []
+        self.token_model.reset_configs([])
         self._notify_change()
-        # Ensure table is properly reset
-        self.table.viewport().update()
         
     def get_template_config(self):
         """Return the current template configuration.
@@ -3124,6 +3743,144 @@ class TableBasedFilenameTemplateBuilder(QtWidgets.QWidget):
 
 # ... existing code ...
 
+def _range_spinner_pattern(token_def, token_cfg, pattern, example):
+    """Fill MIN_VAL/MAX_VAL in a range_spinner token's regex_template."""
+    min_val = token_cfg.get("min_value", token_def.get("default_min", token_def.get("min", 1)))
+    max_val = token_cfg.get("max_value", token_def.get("default_max", token_def.get("max", 10)))
+    # Ensure min_val and max_val are integers for formatting
+    try:
+        min_val = int(min_val)
+        max_val = int(max_val)
+    except (ValueError, TypeError):
+        min_val, max_val = 1, 10 # Fallback
+    
+    pattern = pattern.replace("MIN_VAL", str(min_val)).replace("MAX_VAL", str(max_val))
+    # If regex_template was like '[A-Za-z]{MIN_VAL,MAX_VAL}', example should reflect that
+    if "[A-Za-z]" in pattern or "[a-zA-Z]" in pattern : example = "A" * min_val
+    elif "\\d" in pattern : example = "0" * min_val
+    else: example = f"({min_val}-{max_val} chars)"
+    return pattern, example
+
+def _spinner_pattern(token_def, token_cfg, pattern, example):
+    """Fill {n} in a spinner token's regex_template with the chosen count."""
+    user_value = token_cfg.get("value")
+    n = user_value if user_value is not None else token_def.get("default", 4)
+    try:
+        n = int(n)
+    except (ValueError, TypeError):
+        n = 4 # Fallback
+    pattern = pattern.replace("{n}", str(n))
+    if "\\d" in pattern: example = "0" * n
+    elif "[A-Za-z]" in pattern or "[a-zA-Z]" in pattern: example = "A" * n
+    else: example = f"({n} chars)"
+    return pattern, example
+
+def _dropdown_pattern(token_def, token_cfg, pattern, example):
+    """Narrow a dropdown token to the selected option, or drop it when "none" is picked."""
+    user_value = token_cfg.get("value")
+    # The YAML regex_template is either a group of the options or a generic ".+?";
+    # only the generic placeholder is replaced by the selected value.
+    if user_value and user_value != "none" and user_value in token_def.get("options", []):
+        if pattern == ".+?": # A generic placeholder, make it specific
+            pattern = re.escape(user_value)
+        # A group template such as (?:(LL180|LL360))? already handles optionality
+        example = user_value
+    elif user_value == "none" and "(?:" in pattern and ")?" in pattern: # Optional token, and "none" selected
+        pattern = "" # Make it effectively optional by providing an empty pattern part
+        example = "(optional)"
+    # else, use the regex_template as is (e.g., if it's already an OR group of options)
+    # and the first example from YAML.
+    return pattern, example
+
+def _multiselect_pattern(token_def, token_cfg, pattern, example):
+    """Build an alternation of the selected options, or of all options for a generic template."""
+    user_value = token_cfg.get("value")
+    selected_options = user_value if isinstance(user_value, list) and user_value else []
+    if selected_options:
+        # Use the selected options to form the pattern part, overriding generic regex_template
+        pattern = f"({'|'.join(re.escape(opt) for opt in selected_options)})"
+        example = selected_options[0]
+    elif token_def.get("options"): # No selection, but options exist
+        # Fallback to a pattern matching any of the defined options if regex_template is too generic
+        if pattern == ".+?": # Generic placeholder
+            all_defined_options = [re.escape(opt) for opt in token_def["options"]]
+            if token_def["name"] == "extension":
+                pattern = f"(\\.({'|'.join(all_defined_options)}))"
+            else:
+                pattern = f"({'|'.join(all_defined_options)})"
+        example = f"({token_def['options'][0]})"
+    # If no options selected and no predefined options, regex_template from YAML is used as is.
+    return pattern, example
+
+# (token_def, token_cfg, pattern, example) -> (pattern, example), keyed by token_def["control"]
+_CONTROL_HANDLERS = {
+    "range_spinner": _range_spinner_pattern,
+    "spinner": _spinner_pattern,
+    "dropdown": _dropdown_pattern,
+    "multiselect": _multiselect_pattern,
+}
+
+def _sequence_expectation(token_cfg):
+    min_val = token_cfg.get("min_value", token_cfg.get("value", 2))
+    max_val = token_cfg.get("max_value", token_cfg.get("value", 4))
+    if min_val == max_val:
+        return f"Expected exactly {min_val} letters (uppercase or lowercase) (e.g. {'A' * min_val})"
+    return f"Expected {min_val} to {max_val} letters (uppercase or lowercase) (e.g. {'A' * min_val} minimum)"
+
+def _pixel_mapping_expectation(token_cfg):
+    val = token_cfg.get("value")
+    if val and val != "none":
+        return f"Expected '{val}'"
+    return "Expected LL180/LL360 or skip this token"
+
+def _colorspace_expectation(token_cfg):
+    val = token_cfg.get("value", [])
+    if val and len(val) <= 2:
+        return f"Expected {'/'.join(val)}"
+    elif val:
+        return f"Expected one of {len(val)} configured options"
+    return "Expected r709g24, sRGBg22, ap0lin, etc."
+
+def _fps_expectation(token_cfg):
+    val = token_cfg.get("value")
+    if val:
+        return f"Expected '{val}'"
+    return "Expected 24, 25, 2997, etc."
+
+def _extension_expectation(token_cfg):
+    val = token_cfg.get("value", [])
+    if val and len(val) <= 3:
+        return f"Expected .{' or .'.join(val)}"
+    elif val:
+        return f"Expected one of {len(val)} configured extensions"
+    return "Expected .exr, .jpg, .png, etc."
+
+# Token name -> token_cfg -> the "Expected ..." part of a mismatch message;
+# tokens not listed fall back to their example (see _generate_token_error)
+_TOKEN_ERROR_EXPECTATIONS = {
+    "sequence": _sequence_expectation,
+    "shotNumber": lambda token_cfg: f"Expected {token_cfg.get('value', 4)} digits (e.g. 0010, 1000)",
+    "description": lambda token_cfg: "Expected alphanumeric+hyphens (e.g. comp, roto-main)",
+    "pixelMappingName": _pixel_mapping_expectation,
+    "resolution": lambda token_cfg: "Expected format like 2k, 4k, 12k, HD_1080",
+    "colorspaceGamma": _colorspace_expectation,
+    "fps": _fps_expectation,
+    "version": lambda token_cfg: "Expected v001, v010, v114, etc.",
+    "frame_padding": lambda token_cfg: "Expected %04d to %08d or #### to ########",
+    "extension": _extension_expectation,
+}
+
+@functools.lru_cache(maxsize=256)
+def _compile_token_prefix(pattern, separator):
+    """Compile the regex matching one token (plus its separator) at the start of a filename.
+    
+    Cached because validating a batch of filenames repeats the same few
+    (pattern, separator) pairs for every file.
+    """
+    if separator:
+        pattern += _ESCAPED_SEPS.get(separator) or re.escape(separator)
+    return re.compile(f"^({pattern})")
+
 class FilenameRuleEditor(QtWidgets.QWidget):
     """
     Main widget for the filename rule editor with integrated validation capabilities.
@@ -3146,6 +3903,14 @@ class FilenameRuleEditor(QtWidgets.QWidget):
     def __init__(self, parent=None, available_tokens=None):
         super().__init__(parent)
         self.available_tokens = available_tokens if available_tokens is not None else []
+        # (pattern, example) per token config; see _get_token_pattern_and_example
+        self._token_pattern_cache = {}
+        # Template fingerprint and regex text from the last update_regex() run
+        self._last_regex_fp = None
+        self._last_regex = None
+        
+        # One sheet for the palette buttons, template buttons and the builder's editors
+        self.setStyleSheet(_FILENAME_EDITOR_QSS)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
@@ -3207,24 +3972,7 @@ class FilenameRuleEditor(QtWidgets.QWidget):
             btn = QtWidgets.QPushButton(token_def["label"])
             btn.setToolTip(token_def["desc"])
             btn.setFixedSize(90, 24)  # Larger, more readable buttons
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: #4a4a4a;
-                    color: #e0e0e0;
-                    border: 1px solid #666;
-                    border-radius: 3px;
-                    font-size: 10px;
-                    padding: 2px 4px;
-                }
-                QPushButton:hover { 
-                    background: #5a5a5a; 
-                    border: 1px solid #777;
-                }
-                QPushButton:pressed { 
-                    background: #3a3a3a; 
-                    border: 1px solid #555;
-                }
-            """)
+            btn.setObjectName("tokenPaletteButton")
             btn.clicked.connect(functools.partial(self.add_token_to_template, token_def))
             button_layout.addWidget(btn, row, col)
             self.token_buttons.append(btn)
@@ -3270,6 +4018,7 @@ class FilenameRuleEditor(QtWidgets.QWidget):
         
         # Create template builder
         self.template_builder = TableBasedFilenameTemplateBuilder()
+        self.template_builder.templateChanged.connect(self.update_regex)
         template_scroll_area.setWidget(self.template_builder)
         layout.addWidget(template_scroll_area)
         
@@ -3348,33 +4097,11 @@ class FilenameRuleEditor(QtWidgets.QWidget):
         
         self.save_btn = QtWidgets.QPushButton("Save Template")
         self.save_btn.setFixedHeight(24)
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background: #4a4a4a;
-                color: #e0e0e0;
-                border: 1px solid #666;
-                border-radius: 3px;
-                font-size: 10px;
-                padding: 4px 12px;
-            }
-            QPushButton:hover { background: #5a5a5a; }
-            QPushButton:pressed { background: #3a3a3a; }
-        """)
+        self.save_btn.setObjectName("templateFileButton")
         
         self.load_btn = QtWidgets.QPushButton("Load Template")
         self.load_btn.setFixedHeight(24)
-        self.load_btn.setStyleSheet("""
-            QPushButton {
-                background: #4a4a4a;
-                color: #e0e0e0;
-                border: 1px solid #666;
-                border-radius: 3px;
-                font-size: 10px;
-                padding: 4px 12px;
-            }
-            QPushButton:hover { background: #5a5a5a; }
-            QPushButton:pressed { background: #3a3a3a; }
-        """)
+        self.load_btn.setObjectName("templateFileButton")
         
         btn_layout.addWidget(self.save_btn)
         btn_layout.addWidget(self.load_btn)
@@ -3431,12 +4158,14 @@ class FilenameRuleEditor(QtWidgets.QWidget):
 
     def add_token_to_template(self, token_def):
         """Add a token to the template builder"""
+        # The builder queues the regex update itself, coalesced with any other pending change
         self.template_builder.add_token(token_def)
-        self.update_regex()
 
     def clear_and_update(self):
         """Clear the template and update the display"""
-        self.template_builder.clear()
+        # Don't queue a deferred update; it would refill the fields cleared below with "^$"
+        with self.template_builder.suppress_notifications():
+            self.template_builder.clear()
         self.regex_edit.clear()
         self.example_edit.clear()
 
@@ -3457,9 +4186,19 @@ class FilenameRuleEditor(QtWidgets.QWidget):
         included in the regex pattern as alternatives. If no values are selected,
         it falls back to the default regex template.
         """
-        # import re # Already imported globally at the top of the file
-
         template_config = self.template_builder.get_template_config()
+        # Nothing to do if the template is unchanged and the generated regex is still showing
+        fingerprint = tuple(
+            (token_cfg.get("name"), token_cfg.get("separator"),
+             self._token_key(token_cfg.get("token_def") or {}, token_cfg))
+            for token_cfg in template_config
+        )
+        if fingerprint == self._last_regex_fp and self.regex_edit.text() == self._last_regex:
+            return
+        
+        # Token definitions may have changed along with the template; start from a clean cache
+        self._token_pattern_cache.clear()
+        
         regex_parts = ["^"]  # Start of regex
         example_parts = []
 
@@ -3515,7 +4254,7 @@ class FilenameRuleEditor(QtWidgets.QWidget):
                         next_token_def = next_token_cfg.get("token_def")
                         if not next_token_def:
                             # Fallback to FILENAME_TOKENS if not in template config
-                            next_token_def = next((t for t in FILENAME_TOKENS if t["name"] == next_token_name), None)
+                            next_token_def = FILENAME_TOKENS_BY_NAME.get(next_token_name)
                         
                         if next_token_def:
                             # Check if this next token would actually contribute to the regex
@@ -3525,7 +4264,7 @@ class FilenameRuleEditor(QtWidgets.QWidget):
                                 break
                 
                 if add_separator_flag:
-                    regex_parts.append(re.escape(separator))
+                    regex_parts.append(_ESCAPED_SEPS.get(separator) or re.escape(separator))
                     example_parts.append(separator)
 
         regex_parts.append("$")  # End of regex
@@ -3539,18 +4278,23 @@ class FilenameRuleEditor(QtWidgets.QWidget):
         final_regex_str = re.sub(r'\\d(\d+)(?!\})', r'\\d{\1}', raw_regex_str)
         final_regex_str = re.sub(r'(\[[^\]]+\])(\d+)(?!\})', r'\1{\2}', final_regex_str)
 
+        # The status icon is set below; _on_regex_edit is only for manual edits
+        self.regex_edit.blockSignals(True)
         self.regex_edit.setText(final_regex_str)
+        self.regex_edit.blockSignals(False)
         self.example_edit.setText("".join(example_parts))
+        self._last_regex_fp = fingerprint
+        self._last_regex = final_regex_str
 
         # Validate the generated regex and update the status icon
         try:
             re.compile(final_regex_str)
             # Assuming QtGui is available from `from PySide6 import QtGui`
             if hasattr(self, 'regex_status_icon') and self.regex_status_icon:
-                 self.regex_status_icon.setPixmap(QtGui.QPixmap("icons/success.png"))
+                 self.regex_status_icon.setPixmap(ValidationResultsModel.get_status_pixmap('success', 16))
         except re.error:
             if hasattr(self, 'regex_status_icon') and self.regex_status_icon:
-                self.regex_status_icon.setPixmap(QtGui.QPixmap("icons/error.png"))
+                self.regex_status_icon.setPixmap(ValidationResultsModel.get_status_pixmap('error', 16))
         except AttributeError:
             # This might happen if regex_status_icon is not yet fully initialized,
             # though it should be by the time this method is called.
@@ -3563,7 +4307,7 @@ class FilenameRuleEditor(QtWidgets.QWidget):
         
         # Get the template configuration from the template builder
         template_config = []
-        for row in range(self.template_builder.table.rowCount()):
+        for row in range(len(self.template_builder.token_configs)):
             config = {}
             # Get token data from the table
             if "token_def" in self.template_builder.token_configs[row]:
@@ -3576,10 +4320,6 @@ class FilenameRuleEditor(QtWidgets.QWidget):
             template_config.append(config)
         
         # Open file dialog to save the template
-        from PySide6 import QtWidgets
-        import yaml
-        import os
-        
         options = QtWidgets.QFileDialog.Options()
         file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
             self,
@@ -3614,10 +4354,6 @@ class FilenameRuleEditor(QtWidgets.QWidget):
 
     def load_template(self):
         """Load a template configuration from YAML file and update the template builder."""
-        from PySide6 import QtWidgets
-        import yaml
-        import os
-
         options = QtWidgets.QFileDialog.Options()
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
@@ -3647,7 +4383,7 @@ class FilenameRuleEditor(QtWidgets.QWidget):
                     token_name = config["name"]
                     
                     # Check if there's a master definition in FILENAME_TOKENS
-                    master_def = next((t for t in FILENAME_TOKENS if t["name"] == token_name), None)
+                    master_def = FILENAME_TOKENS_BY_NAME.get(token_name)
                     
                     if master_def:
                         # Use the master definition but preserve the loaded token_def's structure
@@ -3671,12 +4407,12 @@ class FilenameRuleEditor(QtWidgets.QWidget):
                     
                     # Set the token value if provided
                     if "value" in config:
-                        row = self.template_builder.table.rowCount() - 1
+                        row = len(self.template_builder.token_configs) - 1
                         self.template_builder._update_token_value(row, config["value"])
                         
                 elif "separator" in config:
                     # This is a separator
-                    row = self.template_builder.table.rowCount() - 1
+                    row = len(self.template_builder.token_configs) - 1
                     if row >= 0:
                         self.template_builder._update_token_separator(row, config["separator"])
             
@@ -3697,18 +4433,14 @@ class FilenameRuleEditor(QtWidgets.QWidget):
 
     def _on_regex_edit(self):
         """Validate and apply the manually edited regex, updating the status icon and showing errors if invalid."""
-        # Using PySide6 for consistency (was incorrectly using PyQt5)
-        from PySide6 import QtWidgets, QtGui
-        import re
-
         regex_str = self.regex_edit.text()
         try:
             re.compile(regex_str)
             # If valid, set status icon to success (green/checkmark)
-            self.regex_status_icon.setPixmap(QtGui.QPixmap("icons/success.png"))
+            self.regex_status_icon.setPixmap(ValidationResultsModel.get_status_pixmap('success', 16))
             # Optionally, update template config or other state here
         except re.error as e:
-            self.regex_status_icon.setPixmap(QtGui.QPixmap("icons/error.png"))
+            self.regex_status_icon.setPixmap(ValidationResultsModel.get_status_pixmap('error', 16))
             QtWidgets.QMessageBox.critical(self, "Regex Error", f"Invalid regex:\n{e}")
 
     def get_validation_errors(self, filename):
@@ -3749,7 +4481,7 @@ class FilenameRuleEditor(QtWidgets.QWidget):
                 continue
             
             # Check if there's a master definition in FILENAME_TOKENS
-            master_def = next((t for t in FILENAME_TOKENS if t["name"] == token_name), None)
+            master_def = FILENAME_TOKENS_BY_NAME.get(token_name)
             
             # If master definition exists, use its regex_template
             if master_def and "regex_template" in master_def:
@@ -3769,12 +4501,8 @@ class FilenameRuleEditor(QtWidgets.QWidget):
                 expected_pattern, example = self._get_token_pattern_and_example(token_def, token_cfg)
                 
                 # Try to match this token at the start of remaining filename
-                import re
-                pattern_with_separator = expected_pattern
-                if separator and i < len(template_config) - 1:  # Don't add separator to last token
-                    pattern_with_separator += re.escape(separator)
-                
-                match = re.match(f"^({pattern_with_separator})", remaining_filename)
+                token_separator = separator if i < len(template_config) - 1 else ""  # Don't add separator to last token
+                match = _compile_token_prefix(expected_pattern, token_separator).match(remaining_filename)
                 
                 if not match:
                     # Specific error based on token type
@@ -3795,7 +4523,35 @@ class FilenameRuleEditor(QtWidgets.QWidget):
             
         return errors
     
+    @staticmethod
+    def _token_key(token_def, token_cfg):
+        """Hashable summary of everything a token's (pattern, example) depends on."""
+        value = token_cfg.get("value")
+        return (
+            token_def.get("name"),
+            token_def.get("regex_template"),
+            token_def.get("control"),
+            tuple(value) if isinstance(value, list) else value,
+            token_cfg.get("min_value"),
+            token_cfg.get("max_value"),
+        )
+    
     def _get_token_pattern_and_example(self, token_def, token_cfg):
+        """
+        Return the (pattern, example) pair for a token, built by _build_token_pattern_and_example.
+        
+        update_regex() asks for the same tokens repeatedly while looking ahead for
+        separators, and validating a batch of filenames repeats every token per file, so
+        results are cached per token config until the next update_regex().
+        """
+        key = self._token_key(token_def, token_cfg)
+        result = self._token_pattern_cache.get(key)
+        if result is None:
+            result = self._build_token_pattern_and_example(token_def, token_cfg)
+            self._token_pattern_cache[key] = result
+        return result
+    
+    def _build_token_pattern_and_example(self, token_def, token_cfg):
         """
         Generate regex pattern and example for a specific token, primarily using token_def["regex_template"]
         and substituting values from token_cfg where appropriate.
@@ -3805,7 +4561,7 @@ class FilenameRuleEditor(QtWidgets.QWidget):
         token_name = token_def["name"]
         
         # First, check if there's a master definition in FILENAME_TOKENS
-        master_def = next((t for t in FILENAME_TOKENS if t["name"] == token_name), None)
+        master_def = FILENAME_TOKENS_BY_NAME.get(token_name)
         
         # ALWAYS use the regex_template from the master definition if available
         if master_def and "regex_template" in master_def:
@@ -3826,92 +4582,14 @@ class FilenameRuleEditor(QtWidgets.QWidget):
         example_options = token_def.get("examples", [])
         example = example_options[0] if example_options else token_name # Default example
         
-        # Store the separator for use in the pattern and example
-        separator = token_cfg.get("separator", "")
-
-        control_type = token_def.get("control")
-        user_value = token_cfg.get("value") # Value from the UI for this token instance
-
-        if control_type == "range_spinner":
-            min_val = token_cfg.get("min_value", token_def.get("default_min", token_def.get("min", 1)))
-            max_val = token_cfg.get("max_value", token_def.get("default_max", token_def.get("max", 10)))
-            # Ensure min_val and max_val are integers for formatting
-            try:
-                min_val = int(min_val)
-                max_val = int(max_val)
-            except (ValueError, TypeError):
-                min_val, max_val = 1, 10 # Fallback
-            
-            pattern = pattern.replace("MIN_VAL", str(min_val)).replace("MAX_VAL", str(max_val))
-            # If regex_template was like '[A-Za-z]{MIN_VAL,MAX_VAL}', example should reflect that
-            if "[A-Za-z]" in pattern or "[a-zA-Z]" in pattern : example = "A" * min_val
-            elif "\\d" in pattern : example = "0" * min_val
-            else: example = f"({min_val}-{max_val} chars)"
-
-        elif control_type == "spinner":
-            n = user_value if user_value is not None else token_def.get("default", 4)
-            try:
-                n = int(n)
-            except (ValueError, TypeError):
-                n = 4 # Fallback
-            pattern = pattern.replace("{n}", str(n))
-            if "\\d" in pattern: example = "0" * n
-            elif "[A-Za-z]" in pattern or "[a-zA-Z]" in pattern: example = "A" * n
-            else: example = f"({n} chars)"
-
-        elif control_type == "dropdown":
-            # If regex_template is meant to be dynamic based on selection (e.g. "(?:(LL180|LL360))?" )
-            # and user_value is one of the options, we might want to make the pattern specific.
-            # However, to keep it simple and rely on YAML, we assume regex_template is either
-            # a group of options, or the user_value itself if it's not "none".
-            if user_value and user_value != "none" and user_value in token_def.get("options", []):
-                # If the regex_template is a generic placeholder like ".+?" or specific like "(LL180|LL360)"
-                # and the user selected a specific value, use the specific value.
-                # This assumes the YAML's regex_template for dropdowns is either specific or a group.
-                # If it's a group like (LL180|LL360), we let it be. If it's like ".+?", then escape.
-                if pattern == ".+?": # A generic placeholder, make it specific
-                     pattern = re.escape(user_value)
-                # If pattern is already (LL180|LL360) and user_value is LL180, we could make it just LL180
-                # For now, if user_value is not "none", it implies it should be present.
-                # The regex_template from YAML should handle optionality correctly (e.g. using (?:...)? )
-                example = user_value
-            elif user_value == "none" and "(?:" in pattern and ")?" in pattern: # Optional token, and "none" selected
-                pattern = "" # Make it effectively optional by providing an empty pattern part
-                example = "(optional)"
-            # else, use the regex_template as is (e.g., if it's already an OR group of options)
-            # and the first example from YAML.
-
-        elif control_type == "multiselect":
-            selected_options = user_value if isinstance(user_value, list) and user_value else []
-            if selected_options:
-                # Use the selected options to form the pattern part, overriding generic regex_template
-                # Add a dot before extension if this is the extension token
-                if token_name == "extension":
-                    pattern = f"({'|'.join(re.escape(opt) for opt in selected_options)})"
-                else:
-                    pattern = f"({'|'.join(re.escape(opt) for opt in selected_options)})"
-                example = selected_options[0]
-            elif not selected_options and token_def.get("options"): # No selection, but options exist
-                 # Fallback to a pattern matching any of the defined options if regex_template is too generic
-                if pattern == ".+?": # Generic placeholder
-                    all_defined_options = [re.escape(opt) for opt in token_def.get("options", [])]
-                    if all_defined_options:
-                        if token_name == "extension":
-                            pattern = f"(\\.({'|'.join(all_defined_options)}))"
-                        else:
-                            pattern = f"({'|'.join(all_defined_options)})"
-                example = f"({token_def.get('options',[example_options])[0]})"
-
-            # If no options selected and no predefined options, regex_template from YAML is used as is.
-
-        # For "static" or other control types, the regex_template from YAML is used directly.
-        # The example is also taken from YAML.
-
+        # "static" and unknown control types use the regex_template and YAML example as they are
+        handler = _CONTROL_HANDLERS.get(token_def.get("control"))
+        if handler is not None:
+            pattern, example = handler(token_def, token_cfg, pattern, example)
         return pattern, example
     
     def _generate_token_error(self, token_def, token_cfg, remaining_filename, expected_pattern, example):
         """Generate specific error message for a token mismatch"""
-        token_name = token_def["name"]
         label = token_def["label"]
         
         # Get the part of filename we're trying to match (up to next separator or end)
@@ -3921,64 +4599,9 @@ class FilenameRuleEditor(QtWidgets.QWidget):
             filename_preview += "..."
             
         # Condensed error message
-        if token_name == "sequence":
-            min_val = token_cfg.get("min_value", token_cfg.get("value", 2))
-            max_val = token_cfg.get("max_value", token_cfg.get("value", 4))
-            if min_val == max_val:
-                return f"{label}: '{filename_preview}' - Expected exactly {min_val} letters (uppercase or lowercase) (e.g. {'A' * min_val})"
-            else:
-                return f"{label}: '{filename_preview}' - Expected {min_val} to {max_val} letters (uppercase or lowercase) (e.g. {'A' * min_val} minimum)"
-            
-        elif token_name == "shotNumber":
-            n = token_cfg.get("value", 4)
-            return f"{label}: '{filename_preview}' - Expected {n} digits (e.g. 0010, 1000)"
-            
-        elif token_name == "description":
-            return f"{label}: '{filename_preview}' - Expected alphanumeric+hyphens (e.g. comp, roto-main)"
-            
-        elif token_name == "pixelMappingName":
-            val = token_cfg.get("value")
-            if val and val != "none":
-                return f"{label}: '{filename_preview}' - Expected '{val}'"
-            else:
-                return f"{label}: '{filename_preview}' - Expected LL180/LL360 or skip this token"
-                
-        elif token_name == "resolution":
-            return f"{label}: '{filename_preview}' - Expected format like 2k, 4k, 12k, HD_1080"
-            
-        elif token_name == "colorspaceGamma":
-            val = token_cfg.get("value", [])
-            if val and len(val) <= 2:
-                return f"{label}: '{filename_preview}' - Expected {'/'.join(val)}"
-            elif val:
-                return f"{label}: '{filename_preview}' - Expected one of {len(val)} configured options"
-            else:
-                return f"{label}: '{filename_preview}' - Expected r709g24, sRGBg22, ap0lin, etc."
-                
-        elif token_name == "fps":
-            val = token_cfg.get("value")
-            if val:
-                return f"{label}: '{filename_preview}' - Expected '{val}'"
-            else:
-                return f"{label}: '{filename_preview}' - Expected 24, 25, 2997, etc."
-                
-        elif token_name == "version":
-            return f"{label}: '{filename_preview}' - Expected v001, v010, v114, etc."
-            
-        elif token_name == "frame_padding":
-            return f"{label}: '{filename_preview}' - Expected %04d to %08d or #### to ########"
-            
-        elif token_name == "extension":
-            val = token_cfg.get("value", [])
-            if val and len(val) <= 3:
-                return f"{label}: '{filename_preview}' - Expected .{' or .'.join(val)}"
-            elif val:
-                return f"{label}: '{filename_preview}' - Expected one of {len(val)} configured extensions"
-            else:
-                return f"{label}: '{filename_preview}' - Expected .exr, .jpg, .png, etc."
-                
-        else:
-            return f"{label}: '{filename_preview}' - Expected {example}"
+        describe = _TOKEN_ERROR_EXPECTATIONS.get(token_def["name"])
+        expected = describe(token_cfg) if describe else f"Expected {example}"
+        return f"{label}: '{filename_preview}' - {expected}"
 
     def get_validation_summary(self, filename):
         """
@@ -4011,11 +4634,9 @@ class FilenameRuleEditor(QtWidgets.QWidget):
                 if regex_text and regex_text != "^$":
                     # Simple example generation - replace common patterns
                     example = regex_text.replace("^", "").replace("$", "")
-                    example = example.replace("[A-Z]{4}", "DEMO")
-                    example = example.replace("\\d{4}", "0010")
-                    example = example.replace("\\d{1,2}k", "2k")
-                    example = example.replace("v\\d{3}", "v001")
-                    example = example.replace("(?i)(jpg|jpeg|png|mxf|mov|exr)", "jpg")
+                    if any(marker in example for marker in _EXAMPLE_FRAGMENT_MARKERS):
+                        for fragment, sample in _EXAMPLE_SUBS:
+                            example = example.replace(fragment, sample)
                     self.example_edit.setText(example)
                 else:
                     self.example_edit.clear()
@@ -4027,6 +4648,9 @@ class CompactTokenWidget(QtWidgets.QWidget):
     """
     Compact token widget for grid layout
     """
+    # Emitted when the value or separator changes; the builder connects it in add_token
+    templateChanged = QtCore.Signal()
+    
     def __init__(self, token_def, parent=None):
         super().__init__(parent)
         self.token_def = token_def
@@ -4043,36 +4667,14 @@ class CompactTokenWidget(QtWidgets.QWidget):
         
         # Token label
         self.label = QtWidgets.QLabel(token_def["label"])
-        self.label.setStyleSheet("""
-            QLabel {
-                background: #4a4a4a;
-                color: #e0e0e0;
-                border: 1px solid #666;
-                border-radius: 3px;
-                padding: 2px 4px;
-                font-size: 9px;
-                font-weight: bold;
-                min-width: 70px;
-            }
-        """)
+        self.label.setObjectName("compactTokenLabel")
         self.label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         header_layout.addWidget(self.label)
         
         # Remove button
         self.remove_btn = QtWidgets.QPushButton("×")
         self.remove_btn.setFixedSize(16, 16)
-        self.remove_btn.setStyleSheet("""
-            QPushButton {
-                background: #d32f2f;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background: #f44336; }
-            QPushButton:pressed { background: #b71c1c; }
-        """)
+        self.remove_btn.setObjectName("compactRemoveButton")
         header_layout.addWidget(self.remove_btn)
         
         layout.addLayout(header_layout)
@@ -4104,43 +4706,19 @@ class CompactTokenWidget(QtWidgets.QWidget):
         elif token_def["control"] == "static":
             self.control = QtWidgets.QLabel("(auto)")
             self.control.setFixedWidth(60)
-            self.control.setStyleSheet("QLabel { color: #888; font-style: italic; font-size: 8px; }")
         
         if self.control:
-            self.control.setStyleSheet("""
-                QWidget {
-                    background: #3a3a3a;
-                    color: #e0e0e0;
-                    border: 1px solid #555;
-                    border-radius: 2px;
-                    font-size: 8px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    width: 12px;
-                }
-                QComboBox::down-arrow {
-                    border-left: 2px solid transparent;
-                    border-right: 2px solid transparent;
-                    border-top: 2px solid #e0e0e0;
-                }
-            """)
+            self.control.setObjectName("compactTokenControl")
             controls_layout.addWidget(self.control)
+        # Picked once here so get_token_config doesn't re-check the control type per call
+        self._read_value = _control_value_reader(self.control)
         
         # Separator dropdown
         self.separator_combo = QtWidgets.QComboBox()
-        self.separator_combo.addItems(["_", ".", "-", " ", "(none)"])
+        self.separator_combo.setModel(_separator_list_model())
         self.separator_combo.setCurrentText("_")
         self.separator_combo.setFixedWidth(40)
-        self.separator_combo.setStyleSheet("""
-            QComboBox {
-                background: #3a3a3a;
-                color: #e0e0e0;
-                border: 1px solid #555;
-                border-radius: 2px;
-                font-size: 8px;
-            }
-        """)
+        self.separator_combo.setObjectName("compactSeparator")
         controls_layout.addWidget(self.separator_combo)
         
         layout.addLayout(controls_layout)
@@ -4156,19 +4734,7 @@ class CompactTokenWidget(QtWidgets.QWidget):
         self.down_btn.setFixedSize(15, 15)
         
         for btn in [self.up_btn, self.down_btn]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: #4a4a4a;
-                    color: #e0e0e0;
-                    border: 1px solid #666;
-                    border-radius: 2px;
-                    font-size: 8px;
-                    padding: 0px;
-                }
-                QPushButton:hover { background: #5a5a5a; }
-                QPushButton:pressed { background: #2a2a2a; }
-                QPushButton:disabled { background: #2a2a2a; color: #666; }
-            """)
+            btn.setObjectName("compactArrowButton")
         
         move_layout.addWidget(self.up_btn)
         move_layout.addWidget(self.down_btn)
@@ -4184,41 +4750,33 @@ class CompactTokenWidget(QtWidgets.QWidget):
         
         self.separator_combo.currentTextChanged.connect(self._on_control_changed)
         
-        # Widget styling
+        # Styled by the builder's _COMPACT_BUILDER_QSS
         self.setFixedSize(90, 65)  # Compact size
-        self.setStyleSheet("""
-            CompactTokenWidget {
-                background: #383838;
-                border: 1px solid #555;
-                border-radius: 4px;
-                margin: 1px;
-            }
-            CompactTokenWidget:hover {
-                border: 1px solid #4a9eff;
-                background: #404040;
-            }
-        """)
         
     def _on_control_changed(self):
-        """Notify parent when control values change"""
-        parent = self.parent()
-        while parent:
-            if hasattr(parent, 'update_regex'):
-                parent.update_regex()
-                break
-            parent = parent.parent()
+        """Notify the builder when control values change"""
+        self.templateChanged.emit()
+    
+    def reset(self):
+        """Put the control and separator back to their defaults without emitting templateChanged."""
+        self.blockSignals(True)
+        try:
+            if isinstance(self.control, QtWidgets.QSpinBox):
+                self.control.setValue(self.token_def["default"])
+            elif isinstance(self.control, QtWidgets.QComboBox):
+                self.control.setCurrentIndex(0)
+            elif isinstance(self.control, SimpleMultiSelectWidget):
+                self.control.set_selected_values([])
+            self.separator_combo.setCurrentText("_")
+        finally:
+            self.blockSignals(False)
     
     def get_token_config(self):
         """Return the token configuration"""
         value = None
-        if self.control:
+        if self._read_value is not None:
             try:
-                if isinstance(self.control, QtWidgets.QSpinBox):
-                    value = self.control.value()
-                elif isinstance(self.control, QtWidgets.QComboBox):
-                    value = self.control.currentText()
-                elif isinstance(self.control, SimpleMultiSelectWidget):
-                    value = self.control.get_selected_values()
+                value = self._read_value()
             except RuntimeError:
                 value = None
         
@@ -4239,11 +4797,25 @@ class SimpleMultiSelectWidget(QtWidgets.QWidget):
     """
     selectionChanged = QtCore.Signal()
     
+    # Checkable options per distinct options list, shared by every popup built from it
+    _popup_options_cache: Dict[tuple, tuple] = {}
+    # Summary-button labels (truncated past 10 chars) per distinct options list
+    _short_labels_cache: Dict[tuple, Dict[str, str]] = {}
+    
     def __init__(self, options, parent=None):
         super().__init__(parent)
         self.options = options
         self.selected_values = []
         
+        key = tuple(options)
+        self._short_labels = self._short_labels_cache.get(key)
+        if self._short_labels is None:
+            self._short_labels = {
+                option: option if len(option) <= 10 else option[:7] + "..."
+                for option in key
+            }
+            self._short_labels_cache[key] = self._short_labels
+        
         layout = QtWidgets.QHBoxLayout(self)
         layout.setContentsMargins(2, 2, 2, 2)
         
@@ -4252,56 +4824,60 @@ class SimpleMultiSelectWidget(QtWidgets.QWidget):
         self.summary_button.clicked.connect(self._show_popup)
         layout.addWidget(self.summary_button)
         
-        # Create popup
+        # The popup is built on first use; most token widgets never open it
+        self.popup = None
+        self.model = None
+        self.list_view = None
+        
+    def _build_popup(self):
+        """Create the popup list, checking the rows in self.selected_values."""
         self.popup = QtWidgets.QWidget(None, Qt.WindowType.Popup)
-        self.popup.setFixedSize(200, min(300, len(options) * 25 + 20))
+        self.popup.setFixedSize(200, min(300, len(self.options) * 25 + 20))
         
         popup_layout = QtWidgets.QVBoxLayout(self.popup)
         popup_layout.setContentsMargins(5, 5, 5, 5)
         
-        self.checkboxes = {}
-        for option in options:
-            if option != "none":
-                checkbox = QtWidgets.QCheckBox(option)
-                checkbox.setStyleSheet("""
-                    QCheckBox {
-                        color: #333;
-                        font-size: 10px;
-                        background: white;
-                        padding: 2px;
-                    }
-                    QCheckBox::indicator {
-                        width: 12px;
-                        height: 12px;
-                    }
-                    QCheckBox::indicator:unchecked {
-                        background: white;
-                        border: 1px solid #ccc;
-                    }
-                    QCheckBox::indicator:checked {
-                        background: #0078d4;
-                        border: 1px solid #0078d4;
-                    }
-                """)
-                checkbox.stateChanged.connect(self._on_checkbox_changed)
-                self.checkboxes[option] = checkbox
-                popup_layout.addWidget(checkbox)
-        
-        self.popup.setStyleSheet("""
-            QWidget {
-                background: white;
-                border: 2px solid #ccc;
-                border-radius: 4px;
-            }
-        """)
+        # Checkable model rows instead of one QCheckBox per option; the view
+        # only paints the rows that are visible
+        key = tuple(self.options)
+        popup_options = self._popup_options_cache.get(key)
+        if popup_options is None:
+            popup_options = tuple(option for option in key if option != "none")
+            self._popup_options_cache[key] = popup_options
+        
+        self.model = QStandardItemModel(len(popup_options), 1, self.popup)
+        item_flags = Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        for row, option in enumerate(popup_options):
+            item = QStandardItem(option)
+            item.setCheckable(True)
+            item.setFlags(item_flags)
+            self.model.setItem(row, 0, item)
+        
+        self.list_view = QtWidgets.QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
+        popup_layout.addWidget(self.list_view)
+        
+        self.popup.setStyleSheet(_MULTISELECT_POPUP_QSS)
+        
+        # Apply any values set before the popup existed, then start listening for clicks
+        self._apply_selection_to_model()
+        self.model.itemChanged.connect(self._on_checkbox_changed)
         
     def _show_popup(self):
+        if self.popup is None:
+            self._build_popup()
         global_pos = self.summary_button.mapToGlobal(QtCore.QPoint(0, self.summary_button.height()))
         self.popup.move(global_pos)
         self.popup.show()
         
-    def _on_checkbox_changed(self):
-        self.selected_values = [option for option, checkbox in self.checkboxes.items() if checkbox.isChecked()]
+    def _on_checkbox_changed(self, item=None):
+        self.selected_values = []
+        for row in range(self.model.rowCount()):
+            row_item = self.model.item(row)
+            if row_item.checkState() == Qt.CheckState.Checked:
+                self.selected_values.append(row_item.text())
         self._update_summary()
         self.selectionChanged.emit()
         
@@ -4310,9 +4886,11 @@ class SimpleMultiSelectWidget(QtWidgets.QWidget):
             self.summary_button.setText("None")
         elif len(self.selected_values) == 1:
             text = self.selected_values[0]
-            if len(text) > 10:
-                text = text[:7] + "..."
-            self.summary_button.setText(text)
+            short_text = self._short_labels.get(text)
+            if short_text is None:
+                # Loaded values aren't always one of the options
+                short_text = text if len(text) <= 10 else text[:7] + "..."
+            self.summary_button.setText(short_text)
         else:
             self.summary_button.setText(f"{len(self.selected_values)} items")
     
@@ -4323,22 +4901,25 @@ class SimpleMultiSelectWidget(QtWidgets.QWidget):
     def set_selected_values(self, values):
         """Set the selected values"""
         self.selected_values = values.copy() if values else []
-        # Temporarily disconnect signals to prevent _on_checkbox_changed from being called
-        # while we're setting multiple checkboxes
-        for option, checkbox in self.checkboxes.items():
-            checkbox.stateChanged.disconnect()
-        
-        # Set all checkboxes
-        for option, checkbox in self.checkboxes.items():
-            checkbox.setChecked(option in self.selected_values)
-        
-        # Reconnect signals
-        for option, checkbox in self.checkboxes.items():
-            checkbox.stateChanged.connect(self._on_checkbox_changed)
+        # Before the popup is built the values are only stored; _build_popup applies them
+        if self.model is not None:
+            self._apply_selection_to_model()
             
         self._update_summary()
-
-class SimpleFilenameTemplateBuilder(QtWidgets.QWidget):
+        
+    def _apply_selection_to_model(self):
+        """Sync the model's check states to self.selected_values without emitting per row."""
+        selected = set(self.selected_values)
+        # Block the model's itemChanged so _on_checkbox_changed doesn't run once per row
+        self.model.blockSignals(True)
+        for row in range(self.model.rowCount()):
+            item = self.model.item(row)
+            item.setCheckState(Qt.CheckState.Checked if item.text() in selected else Qt.CheckState.Unchecked)
+        self.model.blockSignals(False)
+        # The view doesn't see blocked dataChanged signals, so repaint it once
+        self.list_view.viewport().update()
+
+class SimpleFilenameTemplateBuilder(_TokenWidgetTemplateBuilder):
     """
     Vertically-oriented list-based template builder for filename validation patterns.
     
@@ -4383,7 +4964,9 @@ class SimpleFilenameTemplateBuilder(QtWidgets.QWidget):
         self.container_layout = QtWidgets.QVBoxLayout(self.container)
         self.container_layout.setContentsMargins(4, 4, 4, 4)
         self.container_layout.setSpacing(2)
-        self.container_layout.addStretch()  # Push tokens to top
+        # Push tokens to top; kept so rows can always be inserted just before it
+        self._stretch = QtWidgets.QSpacerItem(0, 0, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.container_layout.addSpacerItem(self._stretch)
         
         self.scroll_area.setWidget(self.container)
         main_layout.addWidget(self.scroll_area)
@@ -4406,8 +4989,12 @@ class SimpleFilenameTemplateBuilder(QtWidgets.QWidget):
         """)
         main_layout.addWidget(clear_btn)
         
-        # Track token widgets
-        self.token_widgets = []
+        # The container layout is the only record of token order: every item before
+        # self._stretch is a token widget
+        
+        # Token name -> widgets taken out by clear(), hidden and waiting for add_token;
+        # see _park_token_widget
+        self._widget_pool: Dict[str, list] = {}
         
         self.setStyleSheet("""
             SimpleFilenameTemplateBuilder {
@@ -4421,26 +5008,37 @@ class SimpleFilenameTemplateBuilder(QtWidgets.QWidget):
             }
         """)
         
+    @property
+    def token_widgets(self):
+        """List of the token widgets in layout order."""
+        return [self.container_layout.itemAt(i).widget() for i in range(self._token_count())]
+        
+    def _token_count(self):
+        """Number of token rows, i.e. the layout index of the stretch."""
+        return self.container_layout.indexOf(self._stretch)
+        
     def add_token(self, token_def):
         """Add a token to the template"""
-        widget = SimpleTokenWidget(token_def)
-        
-        # Connect signals
-        widget.remove_btn.clicked.connect(lambda: self.remove_token(widget))
-        widget.up_btn.clicked.connect(lambda: self.move_token_up(widget))
-        widget.down_btn.clicked.connect(lambda: self.move_token_down(widget))
+        widget = _take_pooled_token_widget(self._widget_pool, token_def)
+        if widget is None:
+            widget = SimpleTokenWidget(token_def)
+            
+            # Connect signals
+            widget.templateChanged.connect(self._notify_change)
+            widget.remove_btn.clicked.connect(self._on_remove_clicked)
+            widget.up_btn.clicked.connect(self._on_up_clicked)
+            widget.down_btn.clicked.connect(self._on_down_clicked)
         
         # Insert before the stretch
-        self.container_layout.insertWidget(len(self.token_widgets), widget)
-        self.token_widgets.append(widget)
+        self.container_layout.insertWidget(self._token_count(), widget)
+        widget.show()
         
         self._update_arrow_states()
         self._notify_change()
-        
+    
     def remove_token(self, widget):
         """Remove a token from the template"""
-        if widget in self.token_widgets:
-            self.token_widgets.remove(widget)
+        if self.container_layout.indexOf(widget) >= 0:
             self.container_layout.removeWidget(widget)
             widget.deleteLater()
             self._update_arrow_states()
@@ -4448,118 +5046,165 @@ class SimpleFilenameTemplateBuilder(QtWidgets.QWidget):
             
     def move_token_up(self, widget):
         """Move token up in the list"""
-        if widget not in self.token_widgets:
-            return
-            
-        index = self.token_widgets.index(widget)
+        index = self.container_layout.indexOf(widget)
         if index > 0:
-            # Swap in list
-            self.token_widgets[index], self.token_widgets[index-1] = self.token_widgets[index-1], self.token_widgets[index]
-            
-            # Remove and re-add widgets in new order
-            for w in self.token_widgets:
-                self.container_layout.removeWidget(w)
-            
-            for i, w in enumerate(self.token_widgets):
-                self.container_layout.insertWidget(i, w)
+            # Only the moved widget changes slot; its neighbour shifts into place
+            self.container_layout.removeWidget(widget)
+            self.container_layout.insertWidget(index-1, widget)
                 
             self._update_arrow_states()
             self._notify_change()
             
     def move_token_down(self, widget):
         """Move token down in the list"""
-        if widget not in self.token_widgets:
-            return
-            
-        index = self.token_widgets.index(widget)
-        if index < len(self.token_widgets) - 1:
-            # Swap in list
-            self.token_widgets[index], self.token_widgets[index+1] = self.token_widgets[index+1], self.token_widgets[index]
-            
-            # Remove and re-add widgets in new order
-            for w in self.token_widgets:
-                self.container_layout.removeWidget(w)
-            
-            for i, w in enumerate(self.token_widgets):
-                self.container_layout.insertWidget(i, w)
+        index = self.container_layout.indexOf(widget)
+        if 0 <= index < self._token_count() - 1:
+            # Only the moved widget changes slot; its neighbour shifts into place
+            self.container_layout.removeWidget(widget)
+            self.container_layout.insertWidget(index+1, widget)
                 
             self._update_arrow_states()
             self._notify_change()
             
     def _update_arrow_states(self):
         """Update the enabled state of up/down arrows"""
-        for i, widget in enumerate(self.token_widgets):
+        token_count = self._token_count()
+        for i in range(token_count):
+            widget = self.container_layout.itemAt(i).widget()
             widget.up_btn.setEnabled(i > 0)
-            widget.down_btn.setEnabled(i < len(self.token_widgets) - 1)
-            
-    def _notify_change(self):
-        """Notify parent of changes"""
-        parent = self.parent()
-        while parent:
-            if hasattr(parent, 'update_regex'):
-                parent.update_regex()
-                break
-            parent = parent.parent()
+            widget.down_btn.setEnabled(i < token_count - 1)
             
-        # Removed duplicate method
-        result = []
-        for widget in self.token_widgets:
-            try:
-                config = widget.get_token_config()
-                result.append(config)
-            except RuntimeError:
-                continue
-        return result
+    def get_template_config(self):
+        """Return the token configurations in template order.
+        
+        Returns:
+            list: List of token configurations with name, value, and separator.
+        """
+        # remove_token/clear take rows out of the layout before deleting or pooling them, and
+        # Qt drops a child from its layout when it is destroyed, so every row here is live
+        return [self.container_layout.itemAt(i).widget().get_token_config() for i in range(self._token_count())]
         
     def clear(self):
         """Clear all tokens"""
-        for widget in self.token_widgets:
-            self.container_layout.removeWidget(widget)
-            widget.deleteLater()
-        self.token_widgets.clear()
+        # Repaint once after the whole template is gone, not once per removed row
+        self.container.setUpdatesEnabled(False)
+        try:
+            # Take from the front until only the stretch is left; the widgets are parked
+            # for add_token to reuse, since switching presets clears and refills the template
+            while self._token_count() > 0:
+                widget = self.container_layout.itemAt(0).widget()
+                self.container_layout.removeWidget(widget)
+                _park_token_widget(self._widget_pool, widget)
+        finally:
+            self.container.setUpdatesEnabled(True)
         self._notify_change()
 
 # Replace the old FilenameTemplateBuilder class completely
 FilenameTemplateBuilder = TableBasedFilenameTemplateBuilder
 
-class RuleItemWidget(QtWidgets.QWidget):
+class _FlowLayout(QtWidgets.QLayout):
     """
-    DEPRECATED: Legacy widget - use ValidationResultsTable instead
-    Kept for backward compatibility during transition
+    Lays widgets out left to right, wrapping onto a new row when the width runs out.
+    
+    Based on Qt's Flow Layout example. Items keep their insertion order, so the
+    compact template builder only has to keep the layout order in step with its
+    token list; where each widget lands is worked out from the available width.
+    
+    Widgets are added with addWidget(), so every item is created (and, on
+    removeWidget(), deleted) by Qt; reordering moves the existing items.
     """
-    def __init__(self, rule_name, parent=None):
-        super(RuleItemWidget, self).__init__(parent)
-        self.rule_name = rule_name
-        
-        # Simple layout for legacy support
-        layout = QtWidgets.QHBoxLayout(self)
-        layout.setContentsMargins(4, 2, 4, 2)
-        
-        # Just show the rule name
-        self.name_label = QtWidgets.QLabel(rule_name)
-        self.name_label.setStyleSheet("QLabel { color: #e0e0e0; }")
-        layout.addWidget(self.name_label)
-        
-        # Status label
-        self.status_label = QtWidgets.QLabel("Legacy widget - use ValidationResultsTable")
-        self.status_label.setStyleSheet("QLabel { color: #ff9800; font-style: italic; }")
-        layout.addWidget(self.status_label)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = []
     
-    def set_status(self, status):
-        """Legacy method"""
-        pass
-
-class CompactFilenameTemplateBuilder(QtWidgets.QWidget):
+    def __del__(self):
+        item = self.takeAt(0)
+        while item:
+            item = self.takeAt(0)
+    
+    def addItem(self, item):
+        self._items.append(item)
+    
+    def moveWidget(self, widget, index):
+        """Move widget's item to position index; does nothing if widget isn't in the layout."""
+        current = self.indexOf(widget)
+        if current < 0 or current == index:
+            return
+        self._items.insert(index, self._items.pop(current))
+        self.invalidate()
+    
+    def count(self):
+        return len(self._items)
+    
+    def itemAt(self, index):
+        if 0 <= index < len(self._items):
+            return self._items[index]
+        return None
+    
+    def takeAt(self, index):
+        if 0 <= index < len(self._items):
+            return self._items.pop(index)
+        return None
+    
+    def expandingDirections(self):
+        return QtCore.Qt.Orientation(0)
+    
+    def hasHeightForWidth(self):
+        return True
+    
+    def heightForWidth(self, width):
+        return self._do_layout(QtCore.QRect(0, 0, width, 0), apply=False)
+    
+    def setGeometry(self, rect):
+        super().setGeometry(rect)
+        self._do_layout(rect, apply=True)
+    
+    def sizeHint(self):
+        return self.minimumSize()
+    
+    def minimumSize(self):
+        size = QtCore.QSize()
+        for item in self._items:
+            size = size.expandedTo(item.minimumSize())
+        margins = self.contentsMargins()
+        return size + QtCore.QSize(margins.left() + margins.right(), margins.top() + margins.bottom())
+    
+    def _do_layout(self, rect, apply):
+        """Place the items inside rect (if apply) and return the height they need."""
+        margins = self.contentsMargins()
+        area = rect.adjusted(margins.left(), margins.top(), -margins.right(), -margins.bottom())
+        spacing = max(self.spacing(), 0)
+        x = area.x()
+        y = area.y()
+        line_height = 0
+        for item in self._items:
+            if item.isEmpty():
+                continue
+            hint = item.sizeHint()
+            next_x = x + hint.width() + spacing
+            if next_x - spacing > area.right() + 1 and line_height > 0:
+                # Wrap onto the next row
+                x = area.x()
+                y += line_height + spacing
+                next_x = x + hint.width() + spacing
+                line_height = 0
+            if apply:
+                item.setGeometry(QtCore.QRect(QtCore.QPoint(x, y), hint))
+            x = next_x
+            line_height = max(line_height, hint.height())
+        return y + line_height - rect.y() + margins.bottom()
+
+class CompactFilenameTemplateBuilder(_TokenWidgetTemplateBuilder):
     """
-    Compact grid-based template builder for filename validation patterns.
+    Compact flow-based template builder for filename validation patterns.
     
-    This widget provides a space-efficient grid layout for building filename templates
+    This widget provides a space-efficient flow layout for building filename templates
     without requiring scroll areas. It dynamically resizes based on content and offers
     an alternative to the table-based template builder for situations where screen
     real estate is limited.
     
     Features:
-        - Compact grid layout for space efficiency
+        - Compact flow layout that re-wraps tokens as the builder is resized
         - Dynamic resizing based on content
         - Simplified token configuration
         - Direct visual representation of the final filename
@@ -4578,15 +5223,14 @@ class CompactFilenameTemplateBuilder(QtWidgets.QWidget):
         
         # Header
         header_label = QtWidgets.QLabel("Template Order:")
-        header_label.setStyleSheet("QLabel { color: #e0e0e0; font-weight: bold; font-size: 11px; }")
+        header_label.setObjectName("compactHeaderLabel")
         main_layout.addWidget(header_label)
         
-        # Grid container for tokens - no scroll area
+        # Flow container for tokens - no scroll area; tokens wrap to the available width
         self.tokens_container = QtWidgets.QWidget()
-        self.tokens_layout = QtWidgets.QGridLayout(self.tokens_container)
+        self.tokens_layout = _FlowLayout(self.tokens_container)
         self.tokens_layout.setContentsMargins(4, 4, 4, 4)
         self.tokens_layout.setSpacing(4)
-        self.tokens_layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop)
         
         main_layout.addWidget(self.tokens_container)
         
@@ -4596,52 +5240,63 @@ class CompactFilenameTemplateBuilder(QtWidgets.QWidget):
         clear_btn = QtWidgets.QPushButton("Clear All")
         clear_btn.setFixedHeight(22)
         clear_btn.clicked.connect(self.clear)
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background: #444;
-                color: #e0e0e0;
-                border: 1px solid #666;
-                border-radius: 2px;
-                padding: 2px 8px;
-                font-size: 10px;
-            }
-            QPushButton:hover { background: #555; }
-            QPushButton:pressed { background: #333; }
-        """)
+        clear_btn.setObjectName("compactClearButton")
         controls_layout.addWidget(clear_btn)
         controls_layout.addStretch()
         
         main_layout.addLayout(controls_layout)
         
-        # Track token widgets and grid position
+        # Token widgets in template order; tokens_layout is kept in the same order
         self.token_widgets = []
-        self.grid_columns = 3  # Number of columns in grid
+        # Set during bulk changes so the layout isn't re-ordered per widget
+        self._suspend_layout = False
+        # Set while a deferred layout update is queued; see _update_grid_layout
+        self._relayout_pending = False
+        # Token name -> widgets taken out by clear(), hidden and waiting for add_token;
+        # see _park_token_widget
+        self._widget_pool: Dict[str, list] = {}
         
-        self.setStyleSheet("""
-            CompactFilenameTemplateBuilder {
-                background: #2a2a2a;
-                border: 1px solid #555;
-                border-radius: 4px;
-            }
-        """)
+        # One sheet for the builder, its header and Clear All button, and every token widget
+        self.setStyleSheet(_COMPACT_BUILDER_QSS)
         
     def add_token(self, token_def):
-        """Add a token to the grid layout"""
-        widget = CompactTokenWidget(token_def)
-        
-        # Connect signals
-        widget.remove_btn.clicked.connect(lambda: self.remove_token(widget))
-        widget.up_btn.clicked.connect(lambda: self.move_token_up(widget))
-        widget.down_btn.clicked.connect(lambda: self.move_token_down(widget))
+        """Add a token to the end of the template"""
+        self.token_widgets.append(self._create_token_widget(token_def))
+        self._update_grid_layout()
+        self._update_arrow_states()
+        self._notify_change()
+    
+    def add_tokens(self, token_defs):
+        """Add several tokens, placing them in the layout and refreshing the arrows once.
         
-        # Add to widgets list and update grid
-        self.token_widgets.append(widget)
+        Use this instead of repeated add_token() calls when loading a template.
+        """
+        if not token_defs:
+            return
+        for token_def in token_defs:
+            self.token_widgets.append(self._create_token_widget(token_def))
         self._update_grid_layout()
         self._update_arrow_states()
         self._notify_change()
+    
+    def _create_token_widget(self, token_def):
+        """Return a pooled or new CompactTokenWidget for token_def, connected to this builder."""
+        widget = _take_pooled_token_widget(self._widget_pool, token_def)
+        if widget is not None:
+            # Still connected from when it was created
+            return widget
+        
+        widget = CompactTokenWidget(token_def)
         
+        # Connect signals
+        widget.templateChanged.connect(self._notify_change)
+        widget.remove_btn.clicked.connect(self._on_remove_clicked)
+        widget.up_btn.clicked.connect(self._on_up_clicked)
+        widget.down_btn.clicked.connect(self._on_down_clicked)
+        return widget
+    
     def remove_token(self, widget):
-        """Remove a token from the grid"""
+        """Remove a token from the template"""
         if widget in self.token_widgets:
             self.token_widgets.remove(widget)
             self.tokens_layout.removeWidget(widget)
@@ -4659,7 +5314,7 @@ class CompactFilenameTemplateBuilder(QtWidgets.QWidget):
         if index > 0:
             # Swap in list
             self.token_widgets[index], self.token_widgets[index-1] = self.token_widgets[index-1], self.token_widgets[index]
-            self._update_grid_layout()
+            self._swap_layout_items(index - 1, index)
             self._update_arrow_states()
             self._notify_change()
             
@@ -4672,19 +5327,76 @@ class CompactFilenameTemplateBuilder(QtWidgets.QWidget):
         if index < len(self.token_widgets) - 1:
             # Swap in list
             self.token_widgets[index], self.token_widgets[index+1] = self.token_widgets[index+1], self.token_widgets[index]
-            self._update_grid_layout()
+            self._swap_layout_items(index, index + 1)
             self._update_arrow_states()
             self._notify_change()
             
+    def _swap_layout_items(self, index_a, index_b):
+        """Move the widgets at index_a < index_b into place after they were swapped in token_widgets"""
+        # A queued layout update puts every widget in place anyway
+        if self._suspend_layout or self._relayout_pending:
+            return
+        self.tokens_layout.moveWidget(self.token_widgets[index_a], index_a)
+        self.tokens_layout.moveWidget(self.token_widgets[index_b], index_b)
+            
     def _update_grid_layout(self):
-        """Update the grid layout with current widgets"""
-        # Clear existing layout
-        for i in reversed(range(self.tokens_layout.count())):
-            item = self.tokens_layout.itemAt(i)
-            if item and item.widget():
-                self.tokens_layout.removeWidget(item.widget())
-        
-        # Re-add widgets in grid pattern
+        """Queue a layout update; adds and removals in one event-loop pass share it."""
+        if self._suspend_layout or self._relayout_pending:
+            return
+        self._relayout_pending = True
+        QtCore.QTimer.singleShot(0, self._flush_grid_layout)
+    
+    def _flush_grid_layout(self):
+        """Run the layout update queued by _update_grid_layout."""
+        self._relayout_pending = False
+        self._do_update_grid_layout()
+    
+    def _do_update_grid_layout(self):
+        """Bring the flow layout's order in line with token_widgets.
+        
+        Only widgets that are new or out of place are added or moved; positions
+        within the flow are left to _FlowLayout.
+        """
+        # Repaint the tokens once after all the moves rather than after each one
+        self.tokens_container.setUpdatesEnabled(False)
+        try:
+            for i, widget in enumerate(self.token_widgets):
+                layout_index = self.tokens_layout.indexOf(widget)
+                if layout_index == i:
+                    continue
+                if layout_index < 0:
+                    self.tokens_layout.addWidget(widget)
+                    # Pooled widgets were hidden explicitly, which the layout won't undo
+                    widget.show()
+                self.tokens_layout.moveWidget(widget, i)
+        finally:
+            self.tokens_container.setUpdatesEnabled(True)
+            
+    def _update_arrow_states(self):
+        """Update the enabled state of up/down arrows"""
+        token_count = len(self.token_widgets)
         for i, widget in enumerate(self.token_widgets):
-            row = i // self.grid_columns
-            col = i % self.grid_columns
+            widget.up_btn.setEnabled(i > 0)
+            widget.down_btn.setEnabled(i < token_count - 1)
+            
+    def get_template_config(self):
+        """Return the token configurations in template order.
+        
+        Returns:
+            list: List of token configurations with name, value, and separator.
+        """
+        return [widget.get_token_config() for widget in self.token_widgets]
+        
+    def clear(self):
+        """Clear all tokens"""
+        # Nothing is left to re-order, so skip the per-widget layout bookkeeping
+        self._suspend_layout = True
+        try:
+            # Parked rather than deleted, since switching presets clears and refills the template
+            for widget in self.token_widgets:
+                self.tokens_layout.removeWidget(widget)
+                _park_token_widget(self._widget_pool, widget)
+            self.token_widgets = []
+        finally:
+            self._suspend_layout = False
+        self._notify_change()